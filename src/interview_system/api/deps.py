@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import os
 import secrets
+from typing import AsyncIterator
 
-from fastapi import Header, Request
+from fastapi import Depends, Header, Request
 
 from interview_system.api.exceptions import APIError
 from interview_system.application.services.admin_service import AdminService
@@ -64,13 +65,17 @@ def require_admin_token(
         )
 
 
-def get_admin_repository(request: Request) -> AdminRepositoryImpl:
+async def get_admin_repository(request: Request) -> AsyncIterator[AdminRepositoryImpl]:
     db = get_database(request)
-    return AdminRepositoryImpl(db)
+    repo = AdminRepositoryImpl(db)
+    # 单个后台请求内的多次查询共用一个会话/连接
+    async with repo.shared_session():
+        yield repo
 
 
-def get_admin_service(request: Request) -> AdminService:
-    repo = get_admin_repository(request)
+def get_admin_service(
+    repo: AdminRepositoryImpl = Depends(get_admin_repository),
+) -> AdminService:
     return AdminService(repo)
 
 
@@ -81,7 +86,13 @@ def get_session_service(request: Request) -> SessionService:
 
 def get_interview_service(request: Request) -> InterviewService:
     from interview_system.common.config import INTERVIEW_CONFIG
-    from interview_system.core.questions import EDU_TYPES, SCENES, TOPICS
+    from interview_system.core.questions import (
+        EDU_TYPES,
+        SCENES,
+        TOPICS,
+        TOPICS_BY_EDU_TYPE,
+        TOPICS_BY_SCENE,
+    )
     from interview_system.integrations.api_helpers import generate_followup
 
     class _LLM:
@@ -111,6 +122,12 @@ def get_interview_service(request: Request) -> InterviewService:
         repository=repo,
         answer_processor=processor,
         followup_generator=followup,
-        topics_source={"TOPICS": TOPICS, "SCENES": SCENES, "EDU_TYPES": EDU_TYPES},
+        topics_source={
+            "TOPICS": TOPICS,
+            "SCENES": SCENES,
+            "EDU_TYPES": EDU_TYPES,
+            "TOPICS_BY_SCENE": TOPICS_BY_SCENE,
+            "TOPICS_BY_EDU_TYPE": TOPICS_BY_EDU_TYPE,
+        },
         total_questions=INTERVIEW_CONFIG.total_questions,
     )
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Literal
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
 from interview_system.api.deps import get_admin_service, require_admin_token
 from interview_system.api.schemas.admin import (
@@ -96,6 +96,30 @@ async def export(
     limit: int = Query(default=5000, ge=1, le=20000),
     offset: int = Query(default=0, ge=0),
 ):
+    file_stem = f"{scope}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+
+    if format == "json":
+        # JSON 逐行从数据库流式导出，不在内存中物化整份结果
+        stream = service.iter_export_rows(
+            scope=scope,
+            start=start,
+            end=end,
+            user_name=user_name,
+            topic=topic,
+            keyword=keyword,
+            min_depth=min_depth,
+            max_depth=max_depth,
+            limit=limit,
+            offset=offset,
+        )
+        return StreamingResponse(
+            service.iter_json(stream),
+            media_type="application/json",
+            headers={
+                "Content-Disposition": f'attachment; filename="{file_stem}.json"'
+            },
+        )
+
     base_name, items = await service.export_rows(
         scope=scope,
         start=start,
@@ -109,18 +133,6 @@ async def export(
         offset=offset,
     )
 
-    file_stem = f"{base_name}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-
-    if format == "json":
-        body = service.to_json(items)
-        return Response(
-            content=body,
-            media_type="application/json",
-            headers={
-                "Content-Disposition": f'attachment; filename="{file_stem}.json"'
-            },
-        )
-
     if format == "xlsx":
         if not items:
             rows: list[list[str]] = [["empty"]]
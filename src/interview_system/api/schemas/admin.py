@@ -35,11 +35,19 @@ class AdminTopicRow(BaseModel):
     avg_depth_score: float = Field(..., ge=0)
 
 
+class AdminDistributionRow(BaseModel):
+    scene: str
+    edu_type: str
+    messages: int = Field(..., ge=0)
+    avg_depth_score: float = Field(..., ge=0)
+
+
 class AdminOverviewResponse(BaseModel):
     summary: AdminOverviewSummary
     time_series: list[AdminTimeSeriesPoint]
     top_users: list[AdminUserActivityRow]
     top_topics: list[AdminTopicRow]
+    distribution: list[AdminDistributionRow] = Field(default_factory=list)
 
 
 class AdminListResponse(BaseModel):
@@ -7,7 +7,7 @@ import io
 import json
 from dataclasses import asdict
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, AsyncIterable, AsyncIterator, Literal
 
 from interview_system.domain.repositories.admin_repository import (
     AdminConversationRow,
@@ -40,6 +40,7 @@ class AdminService:
         ts = await self._repo.get_time_series(start=start, end=end, bucket=bucket)
         users = await self._repo.get_user_activity(start=start, end=end, limit=top_n)
         topics = await self._repo.get_top_topics(start=start, end=end, limit=top_n)
+        distribution = await self._repo.get_distribution(start=start, end=end)
 
         total_sessions = sum(p.sessions for p in ts)
         total_messages = sum(p.messages for p in ts)
@@ -66,6 +67,7 @@ class AdminService:
             "time_series": [asdict(p) for p in ts],
             "top_users": [asdict(u) for u in users],
             "top_topics": [asdict(t) for t in topics],
+            "distribution": [asdict(d) for d in distribution],
         }
 
     async def list_sessions(
@@ -86,15 +88,7 @@ class AdminService:
             limit=limit,
             offset=offset,
         )
-        items: list[dict[str, Any]] = []
-        for r in rows:
-            items.append(
-                {
-                    **asdict(r),
-                    "selected_topics": _safe_json_loads(r.selected_topics_json),
-                }
-            )
-        return {"total": total, "items": items}
+        return {"total": total, "items": [_session_item(r) for r in rows]}
 
     async def search_conversations(
         self,
@@ -173,7 +167,75 @@ class AdminService:
             writer.writerow({k: json.dumps(v, ensure_ascii=False) if isinstance(v, (dict, list)) else v for k, v in item.items()})
         return buf.getvalue().encode("utf-8-sig")
 
-    @staticmethod
-    def to_json(items: list[dict[str, Any]]) -> bytes:
-        return json.dumps(items, ensure_ascii=False, indent=2).encode("utf-8")
+    async def iter_export_rows(
+        self,
+        *,
+        scope: Literal["sessions", "conversations"],
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        keyword: str | None,
+        topic: str | None,
+        min_depth: int | None,
+        max_depth: int | None,
+        limit: int,
+        offset: int,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """与 export_rows 相同的行，逐行从仓储流式读取。"""
+        if scope == "sessions":
+            async for s in self._repo.iter_sessions(
+                start=start,
+                end=end,
+                user_name=user_name,
+                is_finished=None,
+                limit=limit,
+                offset=offset,
+            ):
+                yield _session_item(s)
+            return
+
+        async for c in self._repo.iter_conversations(
+            start=start,
+            end=end,
+            user_name=user_name,
+            topic=topic,
+            keyword=keyword,
+            min_depth=min_depth,
+            max_depth=max_depth,
+            limit=limit,
+            offset=offset,
+        ):
+            yield asdict(c)
 
+    @staticmethod
+    async def iter_json(
+        items: AsyncIterable[dict[str, Any]], *, chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """逐行编码为 JSON 数组并按块产出。
+
+        输出与 json.dumps(items, ensure_ascii=False, indent=2) 逐字节一致：
+        JSON 字符串内的换行均已转义，整体缩进两格只需替换换行符。
+        """
+        parts: list[str] = []
+        size = 0
+        sep = "[\n  "
+        async for item in items:
+            piece = sep + json.dumps(item, ensure_ascii=False, indent=2).replace(
+                "\n", "\n  "
+            )
+            sep = ",\n  "
+            parts.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield "".join(parts).encode("utf-8")
+                parts = []
+                size = 0
+        parts.append("[]" if sep == "[\n  " else "\n]")
+        yield "".join(parts).encode("utf-8")
+
+
+def _session_item(row: AdminSessionRow) -> dict[str, Any]:
+    return {
+        **asdict(row),
+        "selected_topics": _safe_json_loads(row.selected_topics_json),
+    }
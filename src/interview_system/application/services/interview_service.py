@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Sequence
 from uuid import UUID
 
 from interview_system.application.dto.interview_dto import InterviewResultDTO
@@ -21,6 +22,12 @@ from interview_system.domain.services.question_selector import select_questions
 from interview_system.domain.value_objects.conversation_entry import ConversationEntry
 
 
+@lru_cache(maxsize=512)
+def _core_question_text(idx: int, total: int, name: str, question: str) -> str:
+    """核心问题展示文本（题库固定，按题号/题目缓存）。"""
+    return f"【第{idx + 1}/{total}题】{name}:\n{question}"
+
+
 class InterviewService:
     """访谈用例编排。"""
 
@@ -129,7 +136,6 @@ class InterviewService:
             depth_score=0,
             is_ai_generated=bool(session.current_followup_is_ai),
         )
-        await self._repository.append_conversation_entry(session_id, entry)
 
         # 状态前进
         if session.is_followup:
@@ -141,12 +147,12 @@ class InterviewService:
         session.current_question_idx += 1
         if session.current_question_idx >= self._total_questions:
             session.finish()
-            await self._repository.save(session)
+            await self._repository.save(session, new_entries=(entry,))
             return InterviewResultDTO(
                 assistant_message="访谈已结束，感谢您的参与！", is_finished=True
             )
 
-        await self._repository.save(session)
+        await self._repository.save(session, new_entries=(entry,))
         return InterviewResultDTO(
             assistant_message=self._current_question_text(session), is_finished=False
         )
@@ -183,11 +189,8 @@ class InterviewService:
         if session is None:
             raise SessionNotFoundError(session_id)
 
-        # 删除全部日志（逐条删除直到空）
-        while True:
-            deleted = await self._repository.delete_last_conversation_entry(session_id)
-            if deleted is None:
-                break
+        # 删除全部日志（单条 DELETE）
+        await self._repository.delete_conversation_entries(session_id)
 
         session.current_question_idx = 0
         session.is_followup = False
@@ -202,9 +205,13 @@ class InterviewService:
     def _select_topics(
         self, *, topics: list[str] | None, seed: int
     ) -> list[dict[str, Any]]:
-        all_topics: list[dict[str, Any]] = list(self._topics_source["TOPICS"])
-        scenes: list[str] = list(self._topics_source["SCENES"])
-        edu_types: list[str] = list(self._topics_source["EDU_TYPES"])
+        # 题库为只读序列，直接传给选择器，不做逐次拷贝
+        all_topics: Sequence[dict[str, Any]] = self._topics_source["TOPICS"]
+        scenes: Sequence[str] = self._topics_source["SCENES"]
+        edu_types: Sequence[str] = self._topics_source["EDU_TYPES"]
+        # 可选的预分组（core.questions 在导入时计算），缺省时由选择器现场分组
+        scene_groups = self._topics_source.get("TOPICS_BY_SCENE")
+        edu_groups = self._topics_source.get("TOPICS_BY_EDU_TYPE")
 
         if topics:
             wanted = {t.strip() for t in topics if t and t.strip()}
@@ -217,10 +224,14 @@ class InterviewService:
                 edu_types=edu_types,
                 total_questions=self._total_questions,
                 seed=seed,
+                scene_groups=scene_groups,
+                edu_groups=edu_groups,
             )
+            picked = {id(t) for t in filtered}
             for t in base:
-                if t not in filtered:
+                if id(t) not in picked:
                     filtered.append(t)
+                    picked.add(id(t))
                 if len(filtered) >= self._total_questions:
                     break
             return filtered[: self._total_questions]
@@ -231,6 +242,8 @@ class InterviewService:
             edu_types=edu_types,
             total_questions=self._total_questions,
             seed=seed,
+            scene_groups=scene_groups,
+            edu_groups=edu_groups,
         )
 
     def _get_current_topic(self, session: Session) -> dict[str, Any] | None:
@@ -242,9 +255,13 @@ class InterviewService:
         return session.selected_topics[idx]
 
     def _format_core_question(self, *, session: Session, topic: dict[str, Any]) -> str:
-        idx = session.current_question_idx
         question_text = str((topic.get("questions") or [""])[0])
-        return f"【第{idx + 1}/{self._total_questions}题】{topic.get('name', '')}:\n{question_text}"
+        return _core_question_text(
+            session.current_question_idx,
+            self._total_questions,
+            str(topic.get("name", "")),
+            question_text,
+        )
 
     def _current_question_text(self, session: Session) -> str:
         if session.is_followup:
@@ -272,7 +289,6 @@ class InterviewService:
             depth_score=result.depth_score,
             is_ai_generated=False,
         )
-        await self._repository.append_conversation_entry(session.id, entry)
 
         followup = await asyncio.to_thread(
             self._followup_generator.should_followup,
@@ -282,6 +298,7 @@ class InterviewService:
             current_followup_count=session.current_followup_count,
             depth_score=result.depth_score,
             seed=int(session.id.int & 0xFFFFFFFF),
+            answer_len=len(result.answer),
         )
 
         if followup.need_followup:
@@ -289,7 +306,7 @@ class InterviewService:
             session.current_followup_is_ai = followup.is_ai_generated
             session.current_followup_count = session.current_followup_count + 1
             session.current_followup_question = followup.followup_question
-            await self._repository.save(session)
+            await self._repository.save(session, new_entries=(entry,))
             return InterviewResultDTO(
                 assistant_message=followup.followup_question, is_finished=False
             )
@@ -303,12 +320,12 @@ class InterviewService:
 
         if session.current_question_idx >= self._total_questions:
             session.finish()
-            await self._repository.save(session)
+            await self._repository.save(session, new_entries=(entry,))
             return InterviewResultDTO(
                 assistant_message="访谈已结束，感谢您的参与！", is_finished=True
             )
 
-        await self._repository.save(session)
+        await self._repository.save(session, new_entries=(entry,))
         return InterviewResultDTO(
             assistant_message=self._current_question_text(session), is_finished=False
         )
@@ -333,7 +350,6 @@ class InterviewService:
             depth_score=result.depth_score,
             is_ai_generated=result.is_ai_generated,
         )
-        await self._repository.append_conversation_entry(session.id, entry)
 
         followup = await asyncio.to_thread(
             self._followup_generator.should_followup,
@@ -343,6 +359,7 @@ class InterviewService:
             current_followup_count=session.current_followup_count,
             depth_score=result.depth_score,
             seed=int(session.id.int & 0xFFFFFFFF),
+            answer_len=len(result.answer),
         )
 
         if followup.need_followup:
@@ -350,7 +367,7 @@ class InterviewService:
             session.current_followup_is_ai = followup.is_ai_generated
             session.current_followup_count = session.current_followup_count + 1
             session.current_followup_question = followup.followup_question
-            await self._repository.save(session)
+            await self._repository.save(session, new_entries=(entry,))
             return InterviewResultDTO(
                 assistant_message=followup.followup_question, is_finished=False
             )
@@ -364,12 +381,12 @@ class InterviewService:
 
         if session.current_question_idx >= self._total_questions:
             session.finish()
-            await self._repository.save(session)
+            await self._repository.save(session, new_entries=(entry,))
             return InterviewResultDTO(
                 assistant_message="访谈已结束，感谢您的参与！", is_finished=True
             )
 
-        await self._repository.save(session)
+        await self._repository.save(session, new_entries=(entry,))
         return InterviewResultDTO(
             assistant_message=self._current_question_text(session), is_finished=False
         )
@@ -5,7 +5,7 @@
 包含15个访谈话题（3场景 × 5育）
 """
 
-from typing import List, Dict
+from typing import Dict, List, Optional, Tuple
 
 # ----------------------------
 # 访谈话题定义
@@ -227,18 +227,26 @@ TOPICS: List[Dict] = [
 SCENES = ["学校", "家庭", "社区"]
 EDU_TYPES = ["德育", "智育", "体育", "美育", "劳育"]
 
+# 题库为静态常量，分组在导入时计算一次（元组避免被调用方意外修改）
+TOPICS_BY_SCENE: Dict[str, Tuple[Dict, ...]] = {
+    scene: tuple(t for t in TOPICS if t["scene"] == scene) for scene in SCENES
+}
+TOPICS_BY_EDU_TYPE: Dict[str, Tuple[Dict, ...]] = {
+    edu: tuple(t for t in TOPICS if t["edu_type"] == edu) for edu in EDU_TYPES
+}
+
 
 def get_topics_by_scene(scene: str) -> List[Dict]:
     """根据场景获取话题"""
-    return [t for t in TOPICS if t["scene"] == scene]
+    return list(TOPICS_BY_SCENE.get(scene, ()))
 
 
 def get_topics_by_edu_type(edu_type: str) -> List[Dict]:
     """根据五育类型获取话题"""
-    return [t for t in TOPICS if t["edu_type"] == edu_type]
+    return list(TOPICS_BY_EDU_TYPE.get(edu_type, ()))
 
 
-def get_topic_by_name(name: str) -> Dict:
+def get_topic_by_name(name: str) -> Optional[Dict]:
     """根据名称获取话题"""
     for topic in TOPICS:
         if topic["name"] == name:
@@ -14,7 +14,7 @@ class SessionStatus(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """访谈会话（领域实体）。"""
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Protocol
+from typing import AsyncIterator, Protocol
 
 
 @dataclass(frozen=True, slots=True)
@@ -22,6 +22,7 @@ class AdminSessionRow:
     current_followup_is_ai: bool
     current_followup_count: int
     current_followup_question: str
+    log_count: int
 
 
 @dataclass(frozen=True, slots=True)
@@ -61,6 +62,14 @@ class AdminTopicRow:
     avg_depth_score: float
 
 
+@dataclass(frozen=True, slots=True)
+class AdminDistributionRow:
+    scene: str
+    edu_type: str
+    messages: int
+    avg_depth_score: float
+
+
 class AdminRepository(Protocol):
     async def list_sessions(
         self,
@@ -73,6 +82,17 @@ class AdminRepository(Protocol):
         offset: int,
     ) -> tuple[int, list[AdminSessionRow]]: ...
 
+    def iter_sessions(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        is_finished: bool | None,
+        limit: int,
+        offset: int,
+    ) -> AsyncIterator[AdminSessionRow]: ...
+
     async def search_conversations(
         self,
         *,
@@ -87,6 +107,20 @@ class AdminRepository(Protocol):
         offset: int,
     ) -> tuple[int, list[AdminConversationRow]]: ...
 
+    def iter_conversations(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        topic: str | None,
+        keyword: str | None,
+        min_depth: int | None,
+        max_depth: int | None,
+        limit: int,
+        offset: int,
+    ) -> AsyncIterator[AdminConversationRow]: ...
+
     async def get_time_series(
         self,
         *,
@@ -111,3 +145,9 @@ class AdminRepository(Protocol):
         limit: int,
     ) -> list[AdminTopicRow]: ...
 
+    async def get_distribution(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> list[AdminDistributionRow]: ...
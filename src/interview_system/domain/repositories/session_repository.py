@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, Sequence
 from uuid import UUID
 
 from interview_system.domain.entities.session import Session
@@ -12,7 +12,9 @@ from interview_system.domain.value_objects.conversation_entry import Conversatio
 class SessionRepository(Protocol):
     async def get(self, session_id: UUID) -> Session | None: ...
 
-    async def save(self, session: Session) -> None: ...
+    async def save(
+        self, session: Session, *, new_entries: Sequence[ConversationEntry] = ()
+    ) -> None: ...
 
     async def delete(self, session_id: UUID) -> bool: ...
 
@@ -24,6 +26,14 @@ class SessionRepository(Protocol):
         self, session_id: UUID, entry: ConversationEntry
     ) -> None: ...
 
+    async def append_conversation_entries(
+        self, session_id: UUID, entries: Sequence[ConversationEntry]
+    ) -> None: ...
+
     async def delete_last_conversation_entry(
         self, session_id: UUID
     ) -> ConversationEntry | None: ...
+
+    async def delete_conversation_entries(
+        self, session_id: UUID, *, last_n: int | None = None
+    ) -> int: ...
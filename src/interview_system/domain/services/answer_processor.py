@@ -23,6 +23,10 @@ class AnswerResult:
     is_ai_generated: bool = False
 
 
+def _normalize_keywords(keywords: Sequence[str]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(kw.lower() for kw in keywords if kw))
+
+
 class AnswerProcessor:
     """纯计算型处理器。"""
 
@@ -33,31 +37,55 @@ class AnswerProcessor:
         common_keywords: Sequence[str],
         max_depth_score: int,
     ) -> None:
-        self._depth_keywords = tuple(depth_keywords)
-        self._common_keywords = tuple(common_keywords)
+        # 构造时统一小写并去重（保持顺序），匹配时只需对答案小写一次
+        self._depth_keywords = _normalize_keywords(depth_keywords)
+        self._common_keywords = _normalize_keywords(common_keywords)
         self._max_depth_score = int(max_depth_score)
 
     def score_depth(self, answer: str) -> int:
         if not answer:
             return 0
-        text = answer.lower()
-        score = sum(1 for kw in self._depth_keywords if kw in text)
-        return min(score, self._max_depth_score)
+        return self._score_lower(answer.lower())
 
     def extract_keywords(self, answer: str) -> list[str]:
         if not answer:
             return []
+        return self._keywords_lower(answer.lower())
+
+    def analyze(self, answer: str) -> tuple[int, list[str]]:
+        """一次小写同时得到 (深度分, 命中的通用关键词)。"""
+        if not answer:
+            return 0, []
         text = answer.lower()
+        return self._score_lower(text), self._keywords_lower(text)
+
+    def _score_lower(self, text: str) -> int:
+        limit = self._max_depth_score
+        score = 0
+        for kw in self._depth_keywords:
+            if kw in text:
+                score += 1
+                if score >= limit:
+                    break
+        return min(score, limit)
+
+    def _keywords_lower(self, text: str) -> list[str]:
         return [kw for kw in self._common_keywords if kw in text]
 
     def process_core_answer(
-        self, *, answer: str, topic: dict[str, Any], question_text: str | None = None
+        self,
+        *,
+        answer: str,
+        topic: dict[str, Any],
+        question_text: str | None = None,
+        now: datetime | None = None,
     ) -> AnswerResult:
+        """now 可由调用方传入（批量处理时共用同一时间戳，免去逐条取时）。"""
         question = question_text or str((topic.get("questions") or [""])[0])
         valid_answer = answer.strip() or "用户未给出有效回答"
-        depth = self.score_depth(valid_answer)
+        depth = self._score_lower(valid_answer.lower())
         return AnswerResult(
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now or datetime.now(timezone.utc),
             topic=str(topic.get("name", "")),
             question_type="核心问题",
             question=question,
@@ -72,11 +100,12 @@ class AnswerProcessor:
         topic: dict[str, Any],
         followup_question: str,
         is_ai_generated: bool,
+        now: datetime | None = None,
     ) -> AnswerResult:
         valid_answer = answer.strip() or "用户未补充回答"
-        depth = self.score_depth(valid_answer)
+        depth = self._score_lower(valid_answer.lower())
         return AnswerResult(
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now or datetime.now(timezone.utc),
             topic=str(topic.get("name", "")),
             question_type="追问回答",
             question=followup_question or "（追问）",
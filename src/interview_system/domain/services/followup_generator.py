@@ -12,6 +12,9 @@ from dataclasses import dataclass
 from typing import Any, Protocol, Sequence
 
 
+_DEFAULT_PRESETS = ("能再具体说说吗？",)
+
+
 class FollowupLLM(Protocol):
     def generate_followup(
         self,
@@ -51,12 +54,18 @@ class FollowupGenerator:
         current_followup_count: int,
         depth_score: int,
         seed: int | None = None,
+        answer_len: int | None = None,
     ) -> FollowupResult:
-        valid_answer = answer.strip()
+        """answer_len 由调用方给出时，视 answer 为已 strip 的文本，不再重复处理。"""
+        if answer_len is None:
+            valid_answer = answer.strip()
+            answer_len = len(valid_answer)
+        else:
+            valid_answer = answer
         if current_followup_count >= self._max_followups_per_question:
             return FollowupResult(need_followup=False)
 
-        force = (not valid_answer) or (len(valid_answer) < self._min_answer_length)
+        force = answer_len < self._min_answer_length
         if depth_score >= self._max_depth_score:
             return FollowupResult(need_followup=False)
 
@@ -70,8 +79,11 @@ class FollowupGenerator:
 
         # 强制追问时，使用预设追问兜底
         if force:
-            presets = topic.get("followups") or ["能再具体说说吗？"]
-            rng = random.Random(seed)
-            return FollowupResult(True, str(rng.choice(list(presets))), False)
+            presets = topic.get("followups") or _DEFAULT_PRESETS
+            if not isinstance(presets, (list, tuple)):
+                presets = list(presets)
+            # 无种子时用模块级 RNG，免去 Random() 构造时读取系统熵源
+            chooser = random.choice if seed is None else random.Random(seed).choice
+            return FollowupResult(True, str(chooser(presets)), False)
 
         return FollowupResult(need_followup=False)
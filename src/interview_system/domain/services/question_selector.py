@@ -8,10 +8,29 @@
 from __future__ import annotations
 
 import random
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 
+def _group_topics(
+    topics: Sequence[dict[str, Any]],
+    scenes: Sequence[str],
+    edu_types: Sequence[str],
+) -> tuple[dict[str, list[dict[str, Any]]], dict[str, list[dict[str, Any]]]]:
+    scene_groups: dict[str, list[dict[str, Any]]] = {scene: [] for scene in scenes}
+    edu_groups: dict[str, list[dict[str, Any]]] = {edu: [] for edu in edu_types}
+
+    # 单次遍历；不在允许集合中的话题直接跳过（不再为未命中分配临时列表）
+    for topic in topics:
+        scene_group = scene_groups.get(str(topic.get("scene")))
+        if scene_group is not None:
+            scene_group.append(topic)
+        edu_group = edu_groups.get(str(topic.get("edu_type")))
+        if edu_group is not None:
+            edu_group.append(topic)
+    return scene_groups, edu_groups
+
+
 def select_questions(
     *,
     topics: Sequence[dict[str, Any]],
@@ -19,17 +38,35 @@ def select_questions(
     edu_types: Sequence[str],
     total_questions: int,
     seed: int | None = None,
+    scene_groups: Mapping[str, Sequence[dict[str, Any]]] | None = None,
+    edu_groups: Mapping[str, Sequence[dict[str, Any]]] | None = None,
 ) -> list[dict[str, Any]]:
-    rng = random.Random(seed)
+    """按场景/五育覆盖规则选题。
 
-    scene_groups: dict[str, list[dict[str, Any]]] = {scene: [] for scene in scenes}
-    edu_groups: dict[str, list[dict[str, Any]]] = {edu: [] for edu in edu_types}
+    scene_groups/edu_groups 为可选的预分组结果（题库固定时由调用方预先计算），
+    未提供时按 topics 现场分组。
+    """
+    # 无种子时复用模块级 RNG，免去每次构造 Random() 读取系统熵源
+    if seed is None:
+        choice, sample, shuffle = random.choice, random.sample, random.shuffle
+    else:
+        rng = random.Random(seed)
+        choice, sample, shuffle = rng.choice, rng.sample, rng.shuffle
 
-    for topic in topics:
-        scene_groups.get(str(topic.get("scene")), []).append(topic)
-        edu_groups.get(str(topic.get("edu_type")), []).append(topic)
+    if scene_groups is None or edu_groups is None:
+        scene_groups, edu_groups = _group_topics(topics, scenes, edu_types)
 
     selected: list[dict[str, Any]] = []
+    # 题目按位编号，已选集合用一个 int 位掩码表示（题库很小，成员判断即一次位运算）；
+    # 不在 topics 中的预分组对象顺延分配编号，同样参与去重
+    bit_of: dict[int, int] = {id(t): i for i, t in enumerate(topics)}
+    picked_mask = 0
+
+    def _bit(topic: dict[str, Any]) -> int:
+        return bit_of.setdefault(id(topic), len(bit_of))
+
+    # 尚未覆盖的教育类型（有序 dict），随选题增量弹出，无需事后求差集
+    uncovered_edu = dict.fromkeys(edu_types)
 
     # 每个场景至少选一个
     for scene in scenes:
@@ -37,30 +74,36 @@ def select_questions(
             break
         candidates = scene_groups.get(scene) or []
         if candidates:
-            selected.append(rng.choice(candidates))
+            chosen = choice(candidates)
+            selected.append(chosen)
+            picked_mask |= 1 << _bit(chosen)
+            uncovered_edu.pop(str(chosen.get("edu_type")), None)
 
     # 覆盖缺失的教育类型
-    covered_edu = {str(t.get("edu_type")) for t in selected}
-    needed_edu = [e for e in edu_types if e not in covered_edu]
-
     filled: list[dict[str, Any]] = []
-    while needed_edu and len(selected) + len(filled) < total_questions:
-        edu = needed_edu.pop(0)
+    while uncovered_edu and len(selected) + len(filled) < total_questions:
+        edu = next(iter(uncovered_edu))
+        del uncovered_edu[edu]
         candidates = [
-            t
-            for t in (edu_groups.get(edu) or [])
-            if t not in selected and t not in filled
+            t for t in (edu_groups.get(edu) or []) if not (picked_mask >> _bit(t)) & 1
         ]
         if candidates:
-            filled.append(rng.choice(candidates))
+            chosen = choice(candidates)
+            filled.append(chosen)
+            picked_mask |= 1 << _bit(chosen)
+            uncovered_edu.pop(str(chosen.get("edu_type")), None)
 
-    # 补齐剩余
-    remaining = [t for t in topics if t not in selected and t not in filled]
-    while len(selected) + len(filled) < total_questions and remaining:
-        chosen = rng.choice(remaining)
-        filled.append(chosen)
-        remaining.remove(chosen)
+    # 补齐剩余（一次无放回抽样）：按位弹出未选编号，保持题库顺序
+    k = total_questions - len(selected) - len(filled)
+    if k > 0:
+        remaining_mask = ((1 << len(topics)) - 1) & ~picked_mask
+        remaining: list[dict[str, Any]] = []
+        while remaining_mask:
+            low = remaining_mask & -remaining_mask
+            remaining.append(topics[low.bit_length() - 1])
+            remaining_mask ^= low
+        filled.extend(sample(remaining, min(k, len(remaining))))
 
     selected.extend(filled)
-    rng.shuffle(selected)
+    shuffle(selected)
     return selected
@@ -2,20 +2,37 @@
 
 from __future__ import annotations
 
+from typing import Hashable
+from uuid import UUID
+
 from cachetools import TTLCache
 
 from interview_system.domain.entities.session import Session
 
 
 class SessionCache:
+    """会话缓存。
+
+    每个条目可附带版本标记（由仓储决定内容，如 updated_at），
+    命中时仓储可先廉价比对版本，再决定是否复用，避免多进程下读到旧数据。
+    以 UUID 对象作键（Session.id 本身），读写均无需格式化为字符串。
+    """
+
     def __init__(self, *, maxsize: int = 256, ttl_seconds: int = 300) -> None:
-        self._cache: TTLCache[str, Session] = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._cache: TTLCache[UUID, tuple[Hashable, Session]] = TTLCache(
+            maxsize=maxsize, ttl=ttl_seconds
+        )
+
+    def get(self, session_id: UUID) -> Session | None:
+        entry = self._cache.get(session_id)
+        return entry[1] if entry is not None else None
 
-    def get(self, session_id: str) -> Session | None:
+    def get_entry(self, session_id: UUID) -> tuple[Hashable, Session] | None:
+        """返回 (版本, 会话)。"""
         return self._cache.get(session_id)
 
-    def set(self, session: Session) -> None:
-        self._cache[str(session.id)] = session
+    def set(self, session: Session, *, version: Hashable = None) -> None:
+        self._cache[session.id] = (version, session)
 
-    def delete(self, session_id: str) -> None:
+    def delete(self, session_id: UUID) -> None:
         self._cache.pop(session_id, None)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -16,6 +16,30 @@ from sqlalchemy.pool import StaticPool
 
 from interview_system.infrastructure.database.migrations import run_migrations
 
+# 每个新连接执行一次：WAL 允许读写并发，NORMAL 在 WAL 下足够安全且减少 fsync
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+# sqlite3 按连接缓存已编译语句（默认 128）；放宽以容纳全部仓储语句
+_SQLITE_CACHED_STATEMENTS = 256
+
+_HEALTH_CHECK_SQL = text("SELECT 1")
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class AsyncDatabase:
     """异步数据库。"""
@@ -54,25 +78,34 @@ class AsyncDatabase:
         pool_size: int,
         max_overflow: int,
     ) -> AsyncEngine:
-        if url.startswith("sqlite+aiosqlite://") and (
-            ":memory:" in url or url.endswith("/:memory:")
-        ):
-            return create_async_engine(
+        is_sqlite = url.startswith("sqlite+aiosqlite://")
+        if is_sqlite and (":memory:" in url or url.endswith("/:memory:")):
+            engine = create_async_engine(
                 url,
                 echo=echo,
                 poolclass=StaticPool,
-                connect_args={"check_same_thread": False},
+                connect_args={
+                    "check_same_thread": False,
+                    "cached_statements": _SQLITE_CACHED_STATEMENTS,
+                },
+            )
+        else:
+            engine = create_async_engine(
+                url,
+                echo=echo,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                connect_args={
+                    "check_same_thread": False,
+                    "cached_statements": _SQLITE_CACHED_STATEMENTS,
+                }
+                if is_sqlite
+                else {},
             )
 
-        return create_async_engine(
-            url,
-            echo=echo,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-            connect_args={"check_same_thread": False}
-            if url.startswith("sqlite+aiosqlite://")
-            else {},
-        )
+        if is_sqlite:
+            event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+        return engine
 
     async def init(self) -> None:
         """初始化数据库（建表/迁移）。"""
@@ -98,7 +131,8 @@ class AsyncDatabase:
 
     async def health_check(self) -> bool:
         """健康检查。"""
-        await self.execute("SELECT 1")
+        async with self.engine.connect() as conn:
+            await conn.execute(_HEALTH_CHECK_SQL)
         return True
 
     async def dispose(self) -> None:
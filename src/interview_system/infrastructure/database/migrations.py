@@ -3,39 +3,138 @@
 说明：
 - 该项目当前未引入 Alembic；这里提供最小可用的迁移/建表能力
 - 对于已存在的表，仅补齐缺失字段与索引（幂等）
+- 以 PRAGMA user_version 记录结构版本，已是最新时跳过补列与回填；
+  建表、触发器、索引均为 IF NOT EXISTS，每次启动都执行
 """
 
 from __future__ import annotations
 
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 from interview_system.infrastructure.database.models import Base
 
+# 补列/回填变更时递增；库内 user_version 不低于该值即跳过这些步骤
+SCHEMA_VERSION = 3
+
 
 async def run_migrations(*, engine) -> None:
     """执行迁移（幂等）。"""
     async with engine.begin() as conn:
+        result = await conn.execute(text("PRAGMA user_version"))
+        upgrade = result.scalar_one() < SCHEMA_VERSION
+
         await conn.run_sync(Base.metadata.create_all)
+        if upgrade:
+            await _upgrade_columns(conn)
 
-        # sessions 表补齐追问相关字段（幂等）
-        result = await conn.execute(text("PRAGMA table_info(sessions)"))
-        existing = {row[1] for row in result.fetchall()}  # row[1] = name
-
-        required = {
-            "is_followup": "INTEGER DEFAULT 0",
-            "current_followup_is_ai": "INTEGER DEFAULT 0",
-            "current_followup_count": "INTEGER DEFAULT 0",
-            "current_followup_question": "TEXT DEFAULT ''",
-        }
-        for column_name, column_def in required.items():
-            if column_name not in existing:
-                await conn.execute(
-                    text(f"ALTER TABLE sessions ADD COLUMN {column_name} {column_def}")
-                )
+        await conn.execute(
+            text(
+                "CREATE TRIGGER IF NOT EXISTS trg_logs_count_insert "
+                "AFTER INSERT ON conversation_logs BEGIN "
+                "UPDATE sessions SET log_count = log_count + 1 "
+                "WHERE session_id = NEW.session_id; END"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE TRIGGER IF NOT EXISTS trg_logs_count_delete "
+                "AFTER DELETE ON conversation_logs BEGIN "
+                "UPDATE sessions SET log_count = log_count - 1 "
+                "WHERE session_id = OLD.session_id; END"
+            )
+        )
+        await _create_indexes(conn)
+
+        if upgrade:
+            await conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+
+
+async def _upgrade_columns(conn: AsyncConnection) -> None:
+    """补齐旧库缺失的字段并回填（幂等；仅在 user_version 落后时执行）。"""
+    # sessions 表补齐追问相关字段（幂等）
+    result = await conn.execute(text("PRAGMA table_info(sessions)"))
+    existing = {row[1] for row in result.fetchall()}  # row[1] = name
+
+    required = {
+        "is_followup": "INTEGER DEFAULT 0",
+        "current_followup_is_ai": "INTEGER DEFAULT 0",
+        "current_followup_count": "INTEGER DEFAULT 0",
+        "current_followup_question": "TEXT DEFAULT ''",
+    }
+    for column_name, column_def in required.items():
+        if column_name not in existing:
+            await conn.execute(
+                text(f"ALTER TABLE sessions ADD COLUMN {column_name} {column_def}")
+            )
 
+    # sessions.log_count：对话日志条数的物化计数，由触发器维护（幂等）
+    if "log_count" not in existing:
         await conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_session_time ON sessions(start_time)")
+            text("ALTER TABLE sessions ADD COLUMN log_count INTEGER NOT NULL DEFAULT 0")
         )
         await conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_topic ON conversation_logs(topic)")
+            text(
+                "UPDATE sessions SET log_count = ("
+                "SELECT COUNT(*) FROM conversation_logs "
+                "WHERE conversation_logs.session_id = sessions.session_id)"
+            )
         )
+    # sessions.version：行版本号，每次保存递增（幂等）
+    if "version" not in existing:
+        await conn.execute(
+            text("ALTER TABLE sessions ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        )
+
+    # conversation_logs 补齐 scene/edu_type 冗余列，并从 topic 回填（幂等）
+    result = await conn.execute(text("PRAGMA table_info(conversation_logs)"))
+    existing_logs = {row[1] for row in result.fetchall()}
+    added = False
+    for column_name in ("scene", "edu_type"):
+        if column_name not in existing_logs:
+            await conn.execute(
+                text(
+                    f"ALTER TABLE conversation_logs ADD COLUMN {column_name} "
+                    "TEXT NOT NULL DEFAULT ''"
+                )
+            )
+            added = True
+    if added:
+        await conn.execute(
+            text(
+                "UPDATE conversation_logs SET "
+                "scene = substr(topic, 1, instr(topic, '-') - 1), "
+                "edu_type = substr(topic, instr(topic, '-') + 1) "
+                "WHERE instr(topic, '-') > 0"
+            )
+        )
+
+
+async def _create_indexes(conn: AsyncConnection) -> None:
+    """索引增删均为 IF [NOT] EXISTS，廉价且幂等。"""
+    await conn.execute(
+        text("CREATE INDEX IF NOT EXISTS idx_session_time ON sessions(start_time)")
+    )
+    await conn.execute(
+        text("CREATE INDEX IF NOT EXISTS idx_topic ON conversation_logs(topic)")
+    )
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_scene_edu_depth "
+            "ON conversation_logs(scene, edu_type, depth_score)"
+        )
+    )
+    # 单列 scene 索引是上面复合索引的前缀，删除以减少写放大
+    await conn.execute(text("DROP INDEX IF EXISTS idx_scene"))
+    await conn.execute(
+        text("CREATE INDEX IF NOT EXISTS idx_edu_type ON conversation_logs(edu_type)")
+    )
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_session_id_id "
+            "ON conversation_logs(session_id, id)"
+        )
+    )
+    # 单列 session_id 索引已被复合索引覆盖，删除以减少写放大
+    await conn.execute(text("DROP INDEX IF EXISTS ix_conversation_logs_session_id"))
+
@@ -46,6 +46,10 @@ class SessionModel(Base):
     current_followup_question: Mapped[str] = mapped_column(
         String, nullable=False, default=""
     )
+    # 对话日志条数（由 conversation_logs 上的触发器维护，应用代码不写入）
+    log_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 行版本号：每次 save 递增，供会话缓存校验
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     conversation_logs: Mapped[list["ConversationLogModel"]] = relationship(
         back_populates="session",
@@ -59,12 +63,13 @@ class ConversationLogModel(Base):
     __tablename__ = "conversation_logs"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    session_id: Mapped[str] = mapped_column(
-        ForeignKey("sessions.session_id"), index=True
-    )
+    session_id: Mapped[str] = mapped_column(ForeignKey("sessions.session_id"))
 
     timestamp: Mapped[str] = mapped_column(String, nullable=False)
     topic: Mapped[str] = mapped_column(String, nullable=False, default="")
+    # 由 topic（"场景-五育"）拆分的冗余列，供分布统计直接 GROUP BY
+    scene: Mapped[str] = mapped_column(String, nullable=False, default="")
+    edu_type: Mapped[str] = mapped_column(String, nullable=False, default="")
     question_type: Mapped[str] = mapped_column(String, nullable=False, default="")
     question: Mapped[str] = mapped_column(Text, nullable=False, default="")
     answer: Mapped[str] = mapped_column(Text, nullable=False, default="")
@@ -77,3 +82,17 @@ class ConversationLogModel(Base):
 
 Index("idx_session_time", SessionModel.start_time)
 Index("idx_topic", ConversationLogModel.topic)
+Index("idx_edu_type", ConversationLogModel.edu_type)
+# 分布统计按 (scene, edu_type) 分组并聚合 depth_score：覆盖索引，按序扫描无需回表/排序
+Index(
+    "idx_scene_edu_depth",
+    ConversationLogModel.scene,
+    ConversationLogModel.edu_type,
+    ConversationLogModel.depth_score,
+)
+# 覆盖按会话过滤 + 按 id 排序（正序/倒序）的查询，无需额外排序
+Index(
+    "idx_session_id_id",
+    ConversationLogModel.session_id,
+    ConversationLogModel.id,
+)
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from typing import AsyncIterator
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import ColumnElement, Row, Select, and_, func, or_, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from interview_system.domain.repositories.admin_repository import (
     AdminConversationRow,
+    AdminDistributionRow,
     AdminRepository,
     AdminSessionRow,
     AdminTimeSeriesPoint,
@@ -20,14 +24,36 @@ from interview_system.infrastructure.database.models import (
     SessionModel,
 )
 
-_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+# 模块级常量，热路径上免去 timezone.utc 的类属性查找
+_UTC = timezone.utc
+# 导出流式读取的批大小（yield_per）
+_EXPORT_BATCH_SIZE = 500
+
+# 会话列表只读：按列查询返回元组行，不建 ORM 实例/identity map
+_SESSION_ROW_COLUMNS = (
+    SessionModel.session_id,
+    SessionModel.user_name,
+    SessionModel.start_time,
+    SessionModel.end_time,
+    SessionModel.is_finished,
+    SessionModel.current_question_idx,
+    SessionModel.selected_topics,
+    SessionModel.created_at,
+    SessionModel.updated_at,
+    SessionModel.is_followup,
+    SessionModel.current_followup_is_ai,
+    SessionModel.current_followup_count,
+    SessionModel.current_followup_question,
+    SessionModel.log_count,
+)
 
 
 def _to_utc_text(dt: datetime) -> str:
     normalized = dt
     if dt.tzinfo is None:
-        normalized = dt.replace(tzinfo=timezone.utc)
-    return normalized.astimezone(timezone.utc).strftime(_TS_FORMAT)
+        normalized = dt.replace(tzinfo=_UTC)
+    # 与写入端同一格式（"YYYY-MM-DD HH:MM:SS"），isoformat 截取比 strftime 快
+    return normalized.astimezone(_UTC).isoformat(" ", "seconds")[:19]
 
 
 def _bucket_expr(column, bucket: str):  # noqa: ANN001
@@ -39,6 +65,25 @@ def _bucket_expr(column, bucket: str):  # noqa: ANN001
 class AdminRepositoryImpl(AdminRepository):
     def __init__(self, db: AsyncDatabase) -> None:
         self._db = db
+        self._shared: AsyncSession | None = None
+
+    @asynccontextmanager
+    async def shared_session(self) -> AsyncIterator[None]:
+        """作用域内的查询复用同一个 AsyncSession（同一连接），避免逐次签出连接。"""
+        async with self._db.session() as session:
+            self._shared = session
+            try:
+                yield
+            finally:
+                self._shared = None
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        if self._shared is not None:
+            yield self._shared
+            return
+        async with self._db.session() as session:
+            yield session
 
     async def list_sessions(
         self,
@@ -50,51 +95,39 @@ class AdminRepositoryImpl(AdminRepository):
         limit: int,
         offset: int,
     ) -> tuple[int, list[AdminSessionRow]]:
-        where = []
-        if start is not None:
-            where.append(SessionModel.start_time >= _to_utc_text(start))
-        if end is not None:
-            where.append(SessionModel.start_time < _to_utc_text(end))
-        if user_name:
-            where.append(SessionModel.user_name == user_name)
-        if is_finished is not None:
-            where.append(SessionModel.is_finished == (1 if is_finished else 0))
+        where_clause = _session_filters(start, end, user_name, is_finished)
 
-        where_clause = and_(*where) if where else None
-
-        async with self._db.session() as session:
+        async with self._session() as session:
             total_stmt = select(func.count()).select_from(SessionModel)
             if where_clause is not None:
                 total_stmt = total_stmt.where(where_clause)
             total = int((await session.execute(total_stmt)).scalar_one())
 
-            stmt = select(SessionModel).order_by(SessionModel.start_time.desc())
-            if where_clause is not None:
-                stmt = stmt.where(where_clause)
-            stmt = stmt.limit(int(limit)).offset(int(offset))
-            models = (await session.execute(stmt)).scalars().all()
-
-        rows: list[AdminSessionRow] = []
-        for m in models:
-            rows.append(
-                AdminSessionRow(
-                    session_id=m.session_id,
-                    user_name=m.user_name,
-                    start_time=m.start_time,
-                    end_time=m.end_time,
-                    is_finished=bool(m.is_finished),
-                    current_question_idx=int(m.current_question_idx or 0),
-                    selected_topics_json=m.selected_topics,
-                    created_at=m.created_at,
-                    updated_at=m.updated_at,
-                    is_followup=bool(m.is_followup),
-                    current_followup_is_ai=bool(m.current_followup_is_ai),
-                    current_followup_count=int(m.current_followup_count or 0),
-                    current_followup_question=m.current_followup_question or "",
-                )
-            )
+            stmt = _session_rows_stmt(where_clause, limit, offset)
+            records = (await session.execute(stmt)).all()
+
+        return total, [_to_session_row(m) for m in records]
 
-        return total, rows
+    async def iter_sessions(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        is_finished: bool | None,
+        limit: int,
+        offset: int,
+    ) -> AsyncIterator[AdminSessionRow]:
+        """与 list_sessions 同一查询，按批流式产出（导出用，不整表缓冲）。"""
+        where_clause = _session_filters(start, end, user_name, is_finished)
+        stmt = _session_rows_stmt(where_clause, limit, offset)
+        # 独立会话：流式响应可能在请求依赖（shared_session）退出后才被消费
+        async with self._db.session() as session:
+            result = await session.stream(
+                stmt.execution_options(yield_per=_EXPORT_BATCH_SIZE)
+            )
+            async for m in result:
+                yield _to_session_row(m)
 
     async def search_conversations(
         self,
@@ -109,35 +142,12 @@ class AdminRepositoryImpl(AdminRepository):
         limit: int,
         offset: int,
     ) -> tuple[int, list[AdminConversationRow]]:
-        where = []
-        if start is not None:
-            where.append(ConversationLogModel.timestamp >= _to_utc_text(start))
-        if end is not None:
-            where.append(ConversationLogModel.timestamp < _to_utc_text(end))
-        if user_name:
-            where.append(SessionModel.user_name == user_name)
-        if topic:
-            where.append(ConversationLogModel.topic == topic)
-        if min_depth is not None:
-            where.append(ConversationLogModel.depth_score >= int(min_depth))
-        if max_depth is not None:
-            where.append(ConversationLogModel.depth_score <= int(max_depth))
-        if keyword:
-            kw = f"%{keyword.strip().lower()}%"
-            where.append(
-                or_(
-                    func.lower(ConversationLogModel.question).like(kw),
-                    func.lower(ConversationLogModel.answer).like(kw),
-                )
-            )
+        where_clause = _conversation_filters(
+            start, end, user_name, topic, keyword, min_depth, max_depth
+        )
 
-        where_clause = and_(*where) if where else None
-
-        async with self._db.session() as session:
-            base = (
-                select(ConversationLogModel, SessionModel.user_name)
-                .join(SessionModel, SessionModel.session_id == ConversationLogModel.session_id)
-            )
+        async with self._session() as session:
+            base = _conversation_base()
             total_stmt = select(func.count()).select_from(
                 base.subquery()
             )
@@ -152,23 +162,38 @@ class AdminRepositoryImpl(AdminRepository):
             result = await session.execute(stmt)
             items = result.all()
 
-        rows: list[AdminConversationRow] = []
-        for log, uname in items:
-            rows.append(
-                AdminConversationRow(
-                    id=int(log.id),
-                    session_id=log.session_id,
-                    user_name=str(uname or ""),
-                    timestamp=log.timestamp,
-                    topic=log.topic or "",
-                    question_type=log.question_type or "",
-                    question=log.question or "",
-                    answer=log.answer or "",
-                    depth_score=int(log.depth_score or 0),
-                    is_ai_generated=bool(log.is_ai_generated),
-                )
-            )
-        return total, rows
+        return total, [_to_conversation_row(log, uname) for log, uname in items]
+
+    async def iter_conversations(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        topic: str | None,
+        keyword: str | None,
+        min_depth: int | None,
+        max_depth: int | None,
+        limit: int,
+        offset: int,
+    ) -> AsyncIterator[AdminConversationRow]:
+        """与 search_conversations 同一查询，按批流式产出（导出用，不整表缓冲）。"""
+        where_clause = _conversation_filters(
+            start, end, user_name, topic, keyword, min_depth, max_depth
+        )
+        stmt = _conversation_base()
+        if where_clause is not None:
+            stmt = stmt.where(where_clause)
+        stmt = (
+            stmt.order_by(ConversationLogModel.id.desc())
+            .limit(int(limit))
+            .offset(int(offset))
+            .execution_options(yield_per=_EXPORT_BATCH_SIZE)
+        )
+        async with self._db.session() as session:
+            result = await session.stream(stmt)
+            async for log, uname in result:
+                yield _to_conversation_row(log, uname)
 
     async def get_time_series(
         self,
@@ -188,59 +213,66 @@ class AdminRepositoryImpl(AdminRepository):
             session_where.append(SessionModel.start_time < _to_utc_text(end))
             log_where.append(ConversationLogModel.timestamp < _to_utc_text(end))
 
-        async with self._db.session() as session:
-            sess_bucket = _bucket_expr(SessionModel.start_time, bucket).label("bucket")
-            sess_stmt = (
-                select(
-                    sess_bucket,
-                    func.count().label("sessions"),
-                    func.count(func.distinct(SessionModel.user_name)).label("users"),
-                )
-                .select_from(SessionModel)
-                .group_by(sess_bucket)
-                .order_by(sess_bucket.asc())
+        sess_bucket = _bucket_expr(SessionModel.start_time, bucket).label("bucket")
+        sess_stmt = (
+            select(
+                sess_bucket,
+                func.count().label("sessions"),
+                func.count(func.distinct(SessionModel.user_name)).label("users"),
             )
-            if session_where:
-                sess_stmt = sess_stmt.where(and_(*session_where))
-            sess_rows = (await session.execute(sess_stmt)).all()
-
-            log_bucket = _bucket_expr(ConversationLogModel.timestamp, bucket).label("bucket")
-            log_stmt = (
-                select(
-                    log_bucket,
-                    func.count().label("messages"),
-                    func.avg(ConversationLogModel.depth_score).label("avg_depth"),
-                )
-                .select_from(ConversationLogModel)
-                .group_by(log_bucket)
-                .order_by(log_bucket.asc())
+            .select_from(SessionModel)
+            .group_by(sess_bucket)
+        )
+        if session_where:
+            sess_stmt = sess_stmt.where(and_(*session_where))
+        sess_cte = sess_stmt.cte("session_buckets")
+
+        log_bucket = _bucket_expr(ConversationLogModel.timestamp, bucket).label("bucket")
+        log_stmt = (
+            select(
+                log_bucket,
+                func.count().label("messages"),
+                func.avg(ConversationLogModel.depth_score).label("avg_depth"),
             )
-            if log_where:
-                log_stmt = log_stmt.where(and_(*log_where))
-            log_rows = (await session.execute(log_stmt)).all()
-
-        sessions_by_bucket: dict[str, tuple[int, int]] = {
-            str(b): (int(s or 0), int(u or 0)) for b, s, u in sess_rows
-        }
-        logs_by_bucket: dict[str, tuple[int, float]] = {
-            str(b): (int(m or 0), float(d or 0.0)) for b, m, d in log_rows
-        }
-
-        all_buckets = sorted(set(sessions_by_bucket.keys()) | set(logs_by_bucket.keys()))
-        out: list[AdminTimeSeriesPoint] = []
-        for b in all_buckets:
-            s, u = sessions_by_bucket.get(b, (0, 0))
-            m, d = logs_by_bucket.get(b, (0, 0.0))
-            out.append(
-                AdminTimeSeriesPoint(
-                    bucket=b,
-                    sessions=int(s),
-                    messages=int(m),
-                    unique_users=int(u),
-                    avg_depth_score=float(round(d, 4)),
-                )
+            .select_from(ConversationLogModel)
+            .group_by(log_bucket)
+        )
+        if log_where:
+            log_stmt = log_stmt.where(and_(*log_where))
+        log_cte = log_stmt.cte("log_buckets")
+
+        # 两侧分桶在同一条语句内做全外连接，一次往返完成
+        buckets = union(
+            select(sess_cte.c.bucket), select(log_cte.c.bucket)
+        ).cte("buckets")
+        stmt = (
+            select(
+                buckets.c.bucket,
+                sess_cte.c.sessions,
+                sess_cte.c.users,
+                log_cte.c.messages,
+                log_cte.c.avg_depth,
+            )
+            .select_from(
+                buckets.outerjoin(sess_cte, sess_cte.c.bucket == buckets.c.bucket)
+                .outerjoin(log_cte, log_cte.c.bucket == buckets.c.bucket)
             )
-        return out
+            .order_by(buckets.c.bucket.asc())
+        )
+
+        async with self._session() as session:
+            rows = (await session.execute(stmt)).all()
+
+        return [
+            AdminTimeSeriesPoint(
+                bucket=str(b),
+                sessions=int(s or 0),
+                messages=int(m or 0),
+                unique_users=int(u or 0),
+                avg_depth_score=float(round(float(d or 0.0), 4)),
+            )
+            for b, s, u, m, d in rows
+        ]
 
     async def get_user_activity(
         self,
@@ -258,10 +290,22 @@ class AdminRepositoryImpl(AdminRepository):
             session_where.append(SessionModel.start_time < _to_utc_text(end))
             log_where.append(ConversationLogModel.timestamp < _to_utc_text(end))
 
-        async with self._db.session() as session:
+        if not log_where:
+            # 无时间过滤时直接汇总物化计数，免去与日志表的 JOIN + GROUP BY
+            messages = func.sum(SessionModel.log_count)
+            stmt = (
+                select(
+                    SessionModel.user_name.label("user_name"),
+                    func.count().label("sessions"),
+                    messages.label("messages"),
+                )
+                .group_by(SessionModel.user_name)
+                .order_by(messages.desc())
+                .limit(int(limit))
+            )
+        else:
             join_on = [ConversationLogModel.session_id == SessionModel.session_id]
-            if log_where:
-                join_on.extend(log_where)
+            join_on.extend(log_where)
             stmt = (
                 select(
                     SessionModel.user_name.label("user_name"),
@@ -279,6 +323,8 @@ class AdminRepositoryImpl(AdminRepository):
             )
             if session_where:
                 stmt = stmt.where(and_(*session_where))
+
+        async with self._session() as session:
             rows = (await session.execute(stmt)).all()
 
         return [
@@ -303,7 +349,7 @@ class AdminRepositoryImpl(AdminRepository):
         if end is not None:
             where.append(ConversationLogModel.timestamp < _to_utc_text(end))
 
-        async with self._db.session() as session:
+        async with self._session() as session:
             stmt = (
                 select(
                     ConversationLogModel.topic.label("topic"),
@@ -327,3 +373,149 @@ class AdminRepositoryImpl(AdminRepository):
             )
             for r in rows
         ]
+
+    async def get_distribution(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> list[AdminDistributionRow]:
+        where = []
+        if start is not None:
+            where.append(ConversationLogModel.timestamp >= _to_utc_text(start))
+        if end is not None:
+            where.append(ConversationLogModel.timestamp < _to_utc_text(end))
+
+        async with self._session() as session:
+            stmt = (
+                select(
+                    ConversationLogModel.scene.label("scene"),
+                    ConversationLogModel.edu_type.label("edu_type"),
+                    func.count().label("messages"),
+                    func.avg(ConversationLogModel.depth_score).label("avg_depth"),
+                )
+                .select_from(ConversationLogModel)
+                .where(ConversationLogModel.scene != "")
+                .group_by(ConversationLogModel.scene, ConversationLogModel.edu_type)
+                .order_by(ConversationLogModel.scene, ConversationLogModel.edu_type)
+            )
+            if where:
+                stmt = stmt.where(and_(*where))
+            rows = (await session.execute(stmt)).all()
+
+        return [
+            AdminDistributionRow(
+                scene=str(r.scene or ""),
+                edu_type=str(r.edu_type or ""),
+                messages=int(r.messages or 0),
+                avg_depth_score=float(round(float(r.avg_depth or 0.0), 4)),
+            )
+            for r in rows
+        ]
+
+
+def _session_filters(
+    start: datetime | None,
+    end: datetime | None,
+    user_name: str | None,
+    is_finished: bool | None,
+) -> ColumnElement[bool] | None:
+    where = []
+    if start is not None:
+        where.append(SessionModel.start_time >= _to_utc_text(start))
+    if end is not None:
+        where.append(SessionModel.start_time < _to_utc_text(end))
+    if user_name:
+        where.append(SessionModel.user_name == user_name)
+    if is_finished is not None:
+        where.append(SessionModel.is_finished == (1 if is_finished else 0))
+    return and_(*where) if where else None
+
+
+def _session_rows_stmt(
+    where_clause: ColumnElement[bool] | None, limit: int, offset: int
+) -> Select:
+    stmt = select(*_SESSION_ROW_COLUMNS).order_by(SessionModel.start_time.desc())
+    if where_clause is not None:
+        stmt = stmt.where(where_clause)
+    return stmt.limit(int(limit)).offset(int(offset))
+
+
+def _to_session_row(m: Row) -> AdminSessionRow:
+    return AdminSessionRow(
+        session_id=m.session_id,
+        user_name=m.user_name,
+        start_time=m.start_time,
+        end_time=m.end_time,
+        is_finished=bool(m.is_finished),
+        current_question_idx=int(m.current_question_idx or 0),
+        selected_topics_json=m.selected_topics,
+        created_at=m.created_at,
+        updated_at=m.updated_at,
+        is_followup=bool(m.is_followup),
+        current_followup_is_ai=bool(m.current_followup_is_ai),
+        current_followup_count=int(m.current_followup_count or 0),
+        current_followup_question=m.current_followup_question or "",
+        log_count=int(m.log_count or 0),
+    )
+
+
+def _conversation_filters(
+    start: datetime | None,
+    end: datetime | None,
+    user_name: str | None,
+    topic: str | None,
+    keyword: str | None,
+    min_depth: int | None,
+    max_depth: int | None,
+) -> ColumnElement[bool] | None:
+    where = []
+    if start is not None:
+        where.append(ConversationLogModel.timestamp >= _to_utc_text(start))
+    if end is not None:
+        where.append(ConversationLogModel.timestamp < _to_utc_text(end))
+    if user_name:
+        where.append(SessionModel.user_name == user_name)
+    if topic:
+        where.append(ConversationLogModel.topic == topic)
+    if min_depth is not None:
+        where.append(ConversationLogModel.depth_score >= int(min_depth))
+    if max_depth is not None:
+        where.append(ConversationLogModel.depth_score <= int(max_depth))
+    if keyword:
+        # autoescape：用户输入中的 % / _ 按字面匹配，不作为通配符
+        kw = keyword.strip().lower()
+        where.append(
+            or_(
+                func.lower(ConversationLogModel.question).contains(
+                    kw, autoescape=True
+                ),
+                func.lower(ConversationLogModel.answer).contains(
+                    kw, autoescape=True
+                ),
+            )
+        )
+    return and_(*where) if where else None
+
+
+def _conversation_base() -> Select:
+    return select(ConversationLogModel, SessionModel.user_name).join(
+        SessionModel, SessionModel.session_id == ConversationLogModel.session_id
+    )
+
+
+def _to_conversation_row(
+    log: ConversationLogModel, uname: str | None
+) -> AdminConversationRow:
+    return AdminConversationRow(
+        id=int(log.id),
+        session_id=log.session_id,
+        user_name=str(uname or ""),
+        timestamp=log.timestamp,
+        topic=log.topic or "",
+        question_type=log.question_type or "",
+        question=log.question or "",
+        answer=log.answer or "",
+        depth_score=int(log.depth_score or 0),
+        is_ai_generated=bool(log.is_ai_generated),
+    )
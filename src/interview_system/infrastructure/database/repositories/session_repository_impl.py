@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
+import copy
 import json
+from dataclasses import replace
 from datetime import datetime, timezone
+from typing import Any, Sequence, cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    CursorResult,
+    Row,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+try:  # 可选依赖：orjson 序列化/解析更快，未安装时回退标准库 json
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from interview_system.domain.entities.session import Session, SessionStatus
 from interview_system.domain.repositories.session_repository import SessionRepository
@@ -18,67 +38,197 @@ from interview_system.infrastructure.database.models import (
     SessionModel,
 )
 
-_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+# 模块级常量，热路径上免去 timezone.utc 的类属性查找
+_UTC = timezone.utc
+
+# 热路径语句在模块级构建一次，按 session_id 绑定参数执行（编译缓存稳定命中）
+# 读路径只取构造 ConversationEntry 所需的列：不建 ORM 实例、不进 identity map
+_ENTRY_COLUMNS = (
+    ConversationLogModel.timestamp,
+    ConversationLogModel.topic,
+    ConversationLogModel.question_type,
+    ConversationLogModel.question,
+    ConversationLogModel.answer,
+    ConversationLogModel.depth_score,
+    ConversationLogModel.is_ai_generated,
+)
+# 按批流式读取（yield_per），长会话不在驱动层整表缓冲后再转换
+_SELECT_ENTRIES = (
+    select(*_ENTRY_COLUMNS)
+    .where(ConversationLogModel.session_id == bindparam("session_id"))
+    .order_by(ConversationLogModel.id.asc())
+    .execution_options(yield_per=256)
+)
+_SELECT_LAST_ENTRY = (
+    select(ConversationLogModel)
+    .where(ConversationLogModel.session_id == bindparam("session_id"))
+    .order_by(ConversationLogModel.id.desc())
+    .limit(1)
+)
+# 撤销最后一条：单条 DELETE ... RETURNING（max(id) 走复合索引），无需先加载 ORM 实例
+_DELETE_LAST_ENTRY = (
+    delete(ConversationLogModel)
+    .where(
+        ConversationLogModel.id
+        == select(func.max(ConversationLogModel.id))
+        .where(ConversationLogModel.session_id == bindparam("session_id"))
+        .scalar_subquery()
+    )
+    .returning(*_ENTRY_COLUMNS)
+    .execution_options(synchronize_session=False)
+)
+# 倒数第 N 条日志的 id：同会话 id 单调递增，删除 id >= 阈值即删除最后 N 条
+_SELECT_NTH_LAST_ID = (
+    select(ConversationLogModel.id)
+    .where(ConversationLogModel.session_id == bindparam("session_id"))
+    .order_by(ConversationLogModel.id.desc())
+    .limit(1)
+    .offset(bindparam("offset"))
+)
+# 缓存版本标记：主键命中只取 version 一列，远比整行加载 + 话题解码便宜
+_SELECT_VERSION = select(SessionModel.version).where(
+    SessionModel.session_id == bindparam("session_id")
+)
+
+
+# save 的更新/插入语句：列集固定，模块级构建一次（编译缓存稳定命中）
+_SESSION_STATE_VALUES: dict[str, Any] = {
+    "user_name": bindparam("p_user_name"),
+    "is_finished": bindparam("p_is_finished"),
+    "current_question_idx": bindparam("p_current_question_idx"),
+    "selected_topics": bindparam("p_selected_topics"),
+    "is_followup": bindparam("p_is_followup"),
+    "current_followup_is_ai": bindparam("p_current_followup_is_ai"),
+    "current_followup_count": bindparam("p_current_followup_count"),
+    "current_followup_question": bindparam("p_current_followup_question"),
+    "updated_at": bindparam("p_now"),
+}
+_UPDATE_SESSION = (
+    update(SessionModel)
+    .where(SessionModel.session_id == bindparam("p_session_id"))
+    .values(
+        **_SESSION_STATE_VALUES,
+        created_at=func.coalesce(SessionModel.created_at, bindparam("p_now")),
+        version=SessionModel.version + 1,
+    )
+    .execution_options(synchronize_session=False)
+)
+_INSERT_SESSION = insert(SessionModel).values(
+    session_id=bindparam("p_session_id"),
+    start_time=bindparam("p_start_time"),
+    created_at=bindparam("p_now"),
+    version=1,
+    **_SESSION_STATE_VALUES,
+)
+
+
+def _build_upsert(insert_fn):
+    stmt = insert_fn(SessionModel).values(
+        session_id=bindparam("p_session_id"),
+        start_time=bindparam("p_start_time"),
+        created_at=bindparam("p_now"),
+        version=1,
+        **_SESSION_STATE_VALUES,
+    )
+    excluded = stmt.excluded
+    return stmt.on_conflict_do_update(
+        index_elements=[SessionModel.session_id],
+        set_={
+            **{name: excluded[name] for name in _SESSION_STATE_VALUES},
+            "created_at": func.coalesce(SessionModel.created_at, excluded.created_at),
+            "version": SessionModel.version + 1,
+        },
+    ).returning(SessionModel.version)
+
+
+# 支持 ON CONFLICT 的方言：新建/更新都只需一条语句（原子，无先更新后插入的竞态）
+_UPSERT_SESSION = {
+    "sqlite": _build_upsert(sqlite_insert),
+    "postgresql": _build_upsert(pg_insert),
+}
 
 
 class SessionRepositoryImpl(SessionRepository):
-    def __init__(self, db: AsyncDatabase, *, cache: SessionCache | None = None) -> None:
+    def __init__(
+        self,
+        db: AsyncDatabase,
+        *,
+        cache: SessionCache | None = None,
+    ) -> None:
         self._db = db
         self._cache = cache
 
     async def get(self, session_id: UUID) -> Session | None:
         key = str(session_id)
-        if self._cache is not None:
-            cached = self._cache.get(key)
-            if cached is not None:
-                return cached
-
         async with self._db.session() as session:
+            if self._cache is not None:
+                entry = self._cache.get_entry(session_id)
+                if entry is not None:
+                    # 按版本标记校验缓存（其他进程写入后自动失效）
+                    result = await session.execute(_SELECT_VERSION, {"session_id": key})
+                    version = result.scalar_one_or_none()
+                    if version is None:
+                        self._cache.delete(session_id)
+                        return None
+                    if version == entry[0]:
+                        return _copy_session(entry[1])
+
             model = await session.get(SessionModel, key)
             if model is None:
                 return None
             domain = _to_domain_session(model)
             if self._cache is not None:
-                self._cache.set(domain)
+                self._cache.set(_copy_session(domain), version=model.version)
             return domain
 
-    async def save(self, session_obj: Session) -> None:
-        now = datetime.now(timezone.utc)
+    async def save(
+        self,
+        session_obj: Session,
+        *,
+        new_entries: Sequence[ConversationEntry] = (),
+    ) -> None:
+        now_text = _to_ts_text(datetime.now(_UTC))
+        key = str(session_obj.id)
+        # 参数按固定键一次构建，更新/插入共用预编译语句
+        params = {
+            "p_session_id": key,
+            "p_user_name": session_obj.user_name,
+            "p_is_finished": 1 if session_obj.is_finished() else 0,
+            "p_current_question_idx": int(session_obj.current_question_idx),
+            "p_selected_topics": _json_dumps(list(session_obj.selected_topics)),
+            "p_is_followup": 1 if session_obj.is_followup else 0,
+            "p_current_followup_is_ai": 1 if session_obj.current_followup_is_ai else 0,
+            "p_current_followup_count": int(session_obj.current_followup_count),
+            "p_current_followup_question": session_obj.current_followup_question or "",
+            "p_now": now_text,
+        }
+        dialect = self._db.engine.dialect
+        upsert = _UPSERT_SESSION.get(dialect.name) if dialect.insert_returning else None
         async with self._db.transaction() as session:
-            key = str(session_obj.id)
-            model = await session.get(SessionModel, key)
-            if model is None:
-                model = SessionModel(
-                    session_id=key,
-                    user_name=session_obj.user_name,
-                    start_time=session_obj.created_at.astimezone(timezone.utc).strftime(
-                        _TS_FORMAT
-                    ),
+            if upsert is not None:
+                params["p_start_time"] = _to_ts_text(session_obj.created_at)
+                result = await session.execute(upsert, params)
+                version = result.scalar_one()
+            else:
+                # 其他方言/旧版 SQLite：单条 UPDATE（无需先 SELECT 整行）；不存在时再 INSERT
+                updated = cast(
+                    CursorResult, await session.execute(_UPDATE_SESSION, params)
+                )
+                if updated.rowcount:
+                    result = await session.execute(_SELECT_VERSION, {"session_id": key})
+                    version = result.scalar_one()
+                else:
+                    params["p_start_time"] = _to_ts_text(session_obj.created_at)
+                    await session.execute(_INSERT_SESSION, params)
+                    version = 1
+
+            if new_entries:
+                await _insert_entries(
+                    session, key, new_entries, created_at=now_text
                 )
-                session.add(model)
-
-            model.user_name = session_obj.user_name
-            model.is_finished = 1 if session_obj.is_finished() else 0
-            model.current_question_idx = int(session_obj.current_question_idx)
-            model.selected_topics = json.dumps(
-                session_obj.selected_topics, ensure_ascii=False
-            )
-
-            model.is_followup = 1 if session_obj.is_followup else 0
-            model.current_followup_is_ai = (
-                1 if session_obj.current_followup_is_ai else 0
-            )
-            model.current_followup_count = int(session_obj.current_followup_count)
-            model.current_followup_question = (
-                session_obj.current_followup_question or ""
-            )
-
-            if model.created_at is None:
-                model.created_at = now.strftime(_TS_FORMAT)
-            model.updated_at = now.strftime(_TS_FORMAT)
 
         if self._cache is not None:
-            self._cache.set(session_obj)
+            self._cache.set(_copy_session(session_obj), version=version)
 
     async def delete(self, session_id: UUID) -> bool:
         key = str(session_id)
@@ -89,7 +239,7 @@ class SessionRepositoryImpl(SessionRepository):
             await session.delete(model)
 
         if self._cache is not None:
-            self._cache.delete(key)
+            self._cache.delete(session_id)
         return True
 
     async def list_conversation_entries(
@@ -97,42 +247,36 @@ class SessionRepositoryImpl(SessionRepository):
     ) -> list[ConversationEntry]:
         key = str(session_id)
         async with self._db.session() as session:
-            result = await session.execute(
-                select(ConversationLogModel)
-                .where(ConversationLogModel.session_id == key)
-                .order_by(ConversationLogModel.id.asc())
-            )
-            return [_to_domain_entry(m) for m in result.scalars().all()]
+            result = await session.stream(_SELECT_ENTRIES, {"session_id": key})
+            return [_to_domain_entry(row) async for row in result]
 
     async def append_conversation_entry(
         self, session_id: UUID, entry: ConversationEntry
     ) -> None:
+        await self.append_conversation_entries(session_id, (entry,))
+
+    async def append_conversation_entries(
+        self, session_id: UUID, entries: Sequence[ConversationEntry]
+    ) -> None:
+        if not entries:
+            return
         key = str(session_id)
+        now_text = _to_ts_text(datetime.now(_UTC))
         async with self._db.transaction() as session:
-            model = ConversationLogModel(
-                session_id=key,
-                timestamp=entry.timestamp.astimezone(timezone.utc).strftime(_TS_FORMAT),
-                topic=entry.topic,
-                question_type=entry.question_type,
-                question=entry.question,
-                answer=entry.answer,
-                depth_score=int(entry.depth_score),
-                is_ai_generated=1 if entry.is_ai_generated else 0,
-                created_at=datetime.now(timezone.utc).strftime(_TS_FORMAT),
-            )
-            session.add(model)
+            await _insert_entries(session, key, entries, created_at=now_text)
 
     async def delete_last_conversation_entry(
         self, session_id: UUID
     ) -> ConversationEntry | None:
         key = str(session_id)
         async with self._db.transaction() as session:
-            result = await session.execute(
-                select(ConversationLogModel)
-                .where(ConversationLogModel.session_id == key)
-                .order_by(ConversationLogModel.id.desc())
-                .limit(1)
-            )
+            if self._db.engine.dialect.delete_returning:
+                result = await session.execute(_DELETE_LAST_ENTRY, {"session_id": key})
+                row = result.one_or_none()
+                return _to_domain_entry(row) if row is not None else None
+
+            # 旧版 SQLite（< 3.35）不支持 RETURNING：先查后删
+            result = await session.execute(_SELECT_LAST_ENTRY, {"session_id": key})
             model = result.scalar_one_or_none()
             if model is None:
                 return None
@@ -140,24 +284,60 @@ class SessionRepositoryImpl(SessionRepository):
             await session.delete(model)
             return entry
 
+    async def delete_conversation_entries(
+        self, session_id: UUID, *, last_n: int | None = None
+    ) -> int:
+        """删除最后 last_n 条日志（None 表示全部），返回删除条数。"""
+        if last_n is not None and last_n <= 0:
+            return 0
+        key = str(session_id)
+        stmt = delete(ConversationLogModel).where(
+            ConversationLogModel.session_id == key
+        )
+        async with self._db.transaction() as session:
+            if last_n is not None:
+                result = await session.execute(
+                    _SELECT_NTH_LAST_ID, {"session_id": key, "offset": last_n - 1}
+                )
+                threshold = result.scalar_one_or_none()
+                if threshold is not None:
+                    stmt = stmt.where(ConversationLogModel.id >= threshold)
+            deleted = cast(CursorResult, await session.execute(stmt))
+            return int(deleted.rowcount or 0)
+
 
-def _to_domain_session(model: SessionModel) -> Session:
+def _json_dumps(data: Any) -> str:
+    """紧凑 JSON，非 ASCII 原样保留（orjson 默认行为与此一致）。"""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _copy_session(session_obj: Session) -> Session:
+    """缓存与调用方互不共享可变状态：存入、取出时各复制一份。"""
+    return replace(
+        session_obj, selected_topics=copy.deepcopy(session_obj.selected_topics)
+    )
+
+
+def _decode_selected_topics(raw: str) -> list[dict[str, Any]]:
+    """解析 selected_topics JSON；每次返回新对象，避免会话之间共享可变 dict。"""
     try:
-        created_at = datetime.strptime(model.start_time, _TS_FORMAT).replace(
-            tzinfo=timezone.utc
-        )
-    except ValueError:
-        created_at = datetime.now(timezone.utc)
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError 为其子类
+        return []
+    return data if isinstance(data, list) else []
+
+
+def _to_domain_session(model: SessionModel) -> Session:
+    created_at = _parse_ts_text(model.start_time)
 
     status = (
         SessionStatus.COMPLETED if bool(model.is_finished) else SessionStatus.ACTIVE
     )
     selected: list[dict] = []
     if model.selected_topics:
-        try:
-            selected = json.loads(model.selected_topics)
-        except json.JSONDecodeError:
-            selected = []
+        selected = _decode_selected_topics(model.selected_topics)
 
     return Session(
         id=UUID(model.session_id),
@@ -173,11 +353,62 @@ def _to_domain_session(model: SessionModel) -> Session:
     )
 
 
-def _to_domain_entry(model: ConversationLogModel) -> ConversationEntry:
-    try:
-        ts = datetime.strptime(model.timestamp, _TS_FORMAT).replace(tzinfo=timezone.utc)
-    except ValueError:
-        ts = datetime.now(timezone.utc)
+def _split_topic(topic: str) -> dict[str, str]:
+    scene, sep, edu_type = topic.partition("-")
+    if not sep:
+        return {"scene": "", "edu_type": ""}
+    return {"scene": scene, "edu_type": edu_type}
+
+
+def _to_ts_text(dt: datetime) -> str:
+    """转为 UTC 文本时间（"YYYY-MM-DD HH:MM:SS"）。
+
+    isoformat 后截去 "+00:00"：比 strftime 及先 replace(tzinfo=None) 都快。
+    """
+    return dt.astimezone(_UTC).isoformat(" ", "seconds")[:19]
+
+
+def _parse_ts_text(text: str | None) -> datetime:
+    """解析 UTC 文本时间；fromisoformat 为 C 实现，比 strptime 快约 7 倍。"""
+    if text:
+        try:
+            return datetime.fromisoformat(text).replace(tzinfo=_UTC)
+        except ValueError:
+            pass
+    return datetime.now(_UTC)
+
+
+async def _insert_entries(
+    session: AsyncSession,
+    session_key: str,
+    entries: Sequence[ConversationEntry],
+    *,
+    created_at: str,
+) -> None:
+    """批量插入对话日志（单条 INSERT + executemany，调用方负责事务与时间戳）。"""
+    await session.execute(
+        insert(ConversationLogModel),
+        [
+            {
+                "session_id": session_key,
+                "timestamp": _to_ts_text(entry.timestamp),
+                "topic": entry.topic,
+                **_split_topic(entry.topic),
+                "question_type": entry.question_type,
+                "question": entry.question,
+                "answer": entry.answer,
+                "depth_score": int(entry.depth_score),
+                "is_ai_generated": 1 if entry.is_ai_generated else 0,
+                "created_at": created_at,
+            }
+            for entry in entries
+        ],
+    )
+
+
+def _to_domain_entry(model: ConversationLogModel | Row) -> ConversationEntry:
+    """ORM 实例与按列查询的 Row 均可（字段名一致）。"""
+    ts = _parse_ts_text(model.timestamp)
 
     return ConversationEntry(
         timestamp=ts,
@@ -4,11 +4,28 @@
 Unified API Client - Multi-provider LLM support
 """
 
+import asyncio
+import atexit
+import contextlib
+import importlib.util
+import io
 import json
 import os
+import random
+import ssl
+import stat
+import tempfile
+import threading
 import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+try:  # optional: orjson parses small config files faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 import interview_system.common.logger as logger
 from interview_system.common.config import BASE_DIR
@@ -20,12 +37,247 @@ from interview_system.common.constants import MAX_FOLLOWUP_TOKENS, TEST_CALL_TOK
 
 API_CONFIG_FILE = os.path.join(BASE_DIR, "api_config.json")
 ENV_FILE = os.path.join(BASE_DIR, ".env")
+_SYSTEM_MESSAGE = {"role": "system", "content": FOLLOWUP_SYSTEM_PROMPT}
+# 不提供 /models 列表接口的提供商，连通性测试退回最小补全调用
+_COMPLETION_PING_PROVIDERS = frozenset({"baidu"})
+# 追问结果缓存容量：相同 (模型, 完整提示词) 的重复请求直接复用上次结果
+_FOLLOWUP_CACHE_SIZE = 128
+# 流式读取追问：凑够最短长度且以问号结尾即可提前结束，不必等完整生成
+_STREAM_MIN_CHARS = 8
+_STREAM_END_CHARS = ("?", "？")
+# 推理模型把结论放在 reasoning_content，仍走非流式解析
+_REASONING_MODEL_MARKERS = ("reasoner", "-r1")
+
+# httpx 连接池参数（同步/异步共用）；安装 h2（perf 可选依赖）时启用 HTTP/2 多路复用
+_HTTP_LIMITS = {
+    "max_connections": 32,
+    "max_keepalive_connections": 16,
+    "keepalive_expiry": 60,
+}
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# 进程内共享的 SSL 上下文与 httpx 连接池：避免每次建客户端都重新加载证书，
+# 并让重试/连续追问复用已建立的 TLS 连接（单一 API Key，可安全共享）
+_SHARED_SSL: Optional[ssl.SSLContext] = None
+_SHARED_HTTPX = None
+# 可重入：建连接池时会在持锁状态下再取 SSL 上下文
+_SHARED_HTTPX_LOCK = threading.RLock()
+
+
+class _EnvConfig(NamedTuple):
+    """API config resolved from environment variables"""
+
+    provider_id: Optional[str]
+    api_key: Optional[str]
+    secret_key: Optional[str]
+    model: Optional[str]
+
+
+_ENV_CONFIG: Optional[_EnvConfig] = None
+_ENV_CONFIG_LOCK = threading.Lock()
+
+
+def _get_env_config() -> _EnvConfig:
+    """Resolve API_* env vars once, until clear_env_cache() is called"""
+    global _ENV_CONFIG
+    config = _ENV_CONFIG
+    if config is None:
+        with _ENV_CONFIG_LOCK:
+            if _ENV_CONFIG is None:
+                environ = os.environ
+                _ENV_CONFIG = _EnvConfig(
+                    environ.get("API_PROVIDER"),
+                    environ.get("API_KEY"),
+                    environ.get("API_SECRET_KEY"),
+                    environ.get("API_MODEL"),
+                )
+            config = _ENV_CONFIG
+    return config
+
+
+def clear_env_cache() -> None:
+    """Forget the resolved env config; called whenever the API config changes"""
+    global _ENV_CONFIG
+    with _ENV_CONFIG_LOCK:
+        _ENV_CONFIG = None
+
+
+_OPENAI = None  # openai 模块句柄：首次使用时导入并保留
+# 进程内复用的 OpenAI 客户端：(base_url, api_key, secret_key, timeout) -> client
+_CLIENT_CACHE: dict = {}
+
+
+def _import_openai():
+    """Import openai once and keep the module handle; None if not installed"""
+    global _OPENAI
+    if _OPENAI is None:
+        try:
+            import openai
+        except ImportError:
+            return None
+        _OPENAI = openai
+    return _OPENAI
+
 
-def _write_text_atomic(path: str, content: str) -> None:
-    target = Path(path)
-    tmp = target.with_suffix(target.suffix + ".tmp")
-    tmp.write_text(content, encoding="utf-8")
-    tmp.replace(target)
+def _get_ssl_context() -> ssl.SSLContext:
+    """Get (lazily build) the shared SSL context"""
+    global _SHARED_SSL
+    if _SHARED_SSL is not None:
+        return _SHARED_SSL
+
+    with _SHARED_HTTPX_LOCK:
+        if _SHARED_SSL is None:
+            _SHARED_SSL = ssl.create_default_context()
+    return _SHARED_SSL
+
+
+def _get_http_client():
+    """Get (lazily build) the shared httpx client.
+
+    The pool carries no timeout of its own: each OpenAI client passes its
+    timeout on every request, so instances with different timeouts can
+    share it.
+    """
+    global _SHARED_HTTPX
+    if _SHARED_HTTPX is not None:
+        return _SHARED_HTTPX
+
+    with _SHARED_HTTPX_LOCK:
+        if _SHARED_HTTPX is None:
+            import httpx
+
+            _SHARED_HTTPX = httpx.Client(
+                verify=_get_ssl_context(),
+                limits=httpx.Limits(**_HTTP_LIMITS),
+                http2=_HTTP2,
+            )
+    return _SHARED_HTTPX
+
+
+def close_http_client() -> None:
+    """Close the shared httpx client (idempotent)"""
+    global _SHARED_HTTPX
+    with _SHARED_HTTPX_LOCK:
+        client, _SHARED_HTTPX = _SHARED_HTTPX, None
+        _CLIENT_CACHE.clear()
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_http_client)
+
+
+def _collect_stream(stream) -> str:
+    """Concatenate streamed deltas, stopping at the first complete question"""
+    parts = []
+    size = 0
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
+        size += len(delta)
+        if size >= _STREAM_MIN_CHARS and delta.rstrip().endswith(_STREAM_END_CHARS):
+            break
+    return "".join(parts)
+
+
+async def _acollect_stream(stream) -> str:
+    """Async _collect_stream: same early stop at the first complete question"""
+    parts = []
+    size = 0
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
+        size += len(delta)
+        if size >= _STREAM_MIN_CHARS and delta.rstrip().endswith(_STREAM_END_CHARS):
+            break
+    return "".join(parts)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write via a unique temp file in the same dir, then os.replace"""
+    fd, tmp = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path)
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp 建的是 0600 文件；覆盖已有文件时沿用其原权限
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+
+# 已解析的 JSON 配置：path -> ((st_mtime_ns, st_size), data)，文件变化后重新解析
+_JSON_CACHE: dict = {}
+
+
+def _read_json_file(path: str):
+    """Read a JSON file, reusing the parsed data while mtime/size are unchanged"""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    raw = Path(path).read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _JSON_CACHE[path] = (stamp, data)
+    return data
+
+
+# .env 中由本模块管理的行（重写时先剔除再追加；按原始字节比较前缀）
+_ENV_API_PREFIXES = (
+    b"API_PROVIDER=",
+    b"API_KEY=",
+    b"API_MODEL=",
+    b"API_SECRET_KEY=",
+)
+# save_config 写入的块头；仅当紧邻托管块之前时才随块一并删除
+_ENV_API_HEADER = b"# API Configuration"
+
+
+def _rewrite_env_file(api_lines: Sequence[str]) -> None:
+    """Stream .env bytes once, drop managed API lines, append api_lines atomically"""
+    buf = io.BytesIO()
+    header = None  # 暂存的块头行：看到下一行后再决定保留与否
+    try:
+        with open(ENV_FILE, "rb") as f:
+            for line in f:
+                # 仅对缩进行做 lstrip，常见情况直接比较原始行，不额外分配
+                head = line.lstrip() if line[:1] in b" \t" else line
+                managed = head.startswith(_ENV_API_PREFIXES)
+                if header is not None:
+                    if not managed:
+                        buf.write(header)
+                    header = None
+                if managed:
+                    continue
+                if head.rstrip() == _ENV_API_HEADER:
+                    header = line
+                else:
+                    buf.write(line)
+    except FileNotFoundError:
+        pass
+    if header is not None:
+        buf.write(header)
+
+    kept = buf.getvalue().rstrip()
+    if api_lines:
+        block = "\n".join(api_lines).encode("utf-8")
+        kept = kept + b"\n\n" + block if kept else block
+    _write_atomic(ENV_FILE, kept + b"\n" if kept else b"")
 
 
 def migrate_json_to_env() -> bool:
@@ -36,8 +288,7 @@ def migrate_json_to_env() -> bool:
         return False
 
     try:
-        with open(API_CONFIG_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json_file(API_CONFIG_FILE)
 
         env_lines = [
             "# API Configuration (migrated from api_config.json)",
@@ -48,11 +299,12 @@ def migrate_json_to_env() -> bool:
         if data.get("secret_key"):
             env_lines.append(f"API_SECRET_KEY={data.get('secret_key', '')}")
 
-        _write_text_atomic(ENV_FILE, "\n".join(env_lines) + "\n")
+        _rewrite_env_file(env_lines)
 
         # Backup old file
         backup_path = API_CONFIG_FILE + ".bak"
         Path(API_CONFIG_FILE).replace(Path(backup_path))
+        _JSON_CACHE.pop(API_CONFIG_FILE, None)
         logger.info(f"已迁移配置到 .env，原文件备份为 {backup_path}")
         return True
     except Exception as e:
@@ -65,6 +317,8 @@ class UnifiedAPIClient:
 
     def __init__(self):
         self.client = None
+        # AsyncOpenAI 及其 httpx 连接池绑定创建时的事件循环：按循环各建一个
+        self._aclients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
         self.is_available = False
         self.current_provider: Optional[APIProviderConfig] = None
         self.api_key: Optional[str] = None
@@ -73,115 +327,92 @@ class UnifiedAPIClient:
         self.timeout: int = 15
         self.max_retries: int = 3
         self.retry_delay: float = 1.0
+        self._backoff: tuple = ()
+        self._backoff_params: Optional[tuple] = None
         self._lazy_initialized = False
+        self._followup_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._followup_cache_lock = threading.Lock()
         self._load_config()
 
     def _load_config(self) -> bool:
         """Load API config from env vars first, then file (backward compat)"""
         # Priority 1: Environment variables
-        provider_id = os.getenv("API_PROVIDER")
-        api_key = os.getenv("API_KEY")
-
-        if provider_id and api_key and provider_id in API_PROVIDERS:
-            self.current_provider = API_PROVIDERS[provider_id]
-            self.api_key = api_key
-            self.secret_key = os.getenv("API_SECRET_KEY")
-            self.model = os.getenv("API_MODEL") or self.current_provider.default_model
-            logger.info(f"已从环境变量加载API配置：{self.current_provider.name}")
+        env = _get_env_config()
+        provider = API_PROVIDERS.get(env.provider_id) if env.provider_id else None
+
+        if provider is not None and env.api_key:
+            self.current_provider = provider
+            self.api_key = env.api_key
+            self.secret_key = env.secret_key
+            self.model = env.model or provider.default_model
+            logger.info(f"已从环境变量加载API配置：{provider.name}")
             return True
 
         # Priority 2: JSON file (backward compat)
-        if not os.path.exists(API_CONFIG_FILE):
-            return False
-
         try:
-            with open(API_CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
+            data = _read_json_file(API_CONFIG_FILE)
             provider_id = data.get("provider_id")
-            if provider_id and provider_id in API_PROVIDERS:
-                self.current_provider = API_PROVIDERS[provider_id]
+            provider = API_PROVIDERS.get(provider_id) if provider_id else None
+            if provider is not None:
+                self.current_provider = provider
                 self.api_key = data.get("api_key")
                 self.secret_key = data.get("secret_key")
-                self.model = data.get("model") or self.current_provider.default_model
-                logger.info(f"已从文件加载API配置：{self.current_provider.name}")
+                self.model = data.get("model") or provider.default_model
+                logger.info(f"已从文件加载API配置：{provider.name}")
                 return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             logger.warning(f"加载API配置失败：{e}")
 
         return False
 
     def _lazy_init_client(self) -> bool:
-        """Lazy init client on first use"""
-        if self._lazy_initialized:
-            return self.is_available
+        """Lazy init client on first use; returns whether a client is ready"""
+        if self.is_available and self.client is not None:
+            return True
 
-        if not self.current_provider or not self.api_key:
+        # 仅"未安装 openai"这类永久性失败会锁定；瞬时异常下次调用时重试
+        if self._lazy_initialized or not self.current_provider or not self.api_key:
             return False
 
-        try:
-            import openai
-
-            client_kwargs = {
-                "api_key": self.api_key,
-                "base_url": self.current_provider.base_url,
-                "timeout": self.timeout,
-            }
-
-            if self.current_provider.provider_id == "baidu" and self.secret_key:
-                client_kwargs["default_headers"] = {
-                    "X-Bce-Signature-Key": self.secret_key
-                }
+        openai = _import_openai()
+        if openai is None:
+            logger.warning("延迟初始化API客户端失败：未安装 openai 库")
+            self._lazy_initialized = True
+            return False
 
-            self.client = openai.OpenAI(**client_kwargs)
+        try:
+            provider = self.current_provider
+            self.client = self._get_openai_client(
+                openai, provider, self.api_key, self.secret_key
+            )
             self.is_available = True
-            self._lazy_initialized = True
-            logger.info(f"延迟初始化API客户端成功：{self.current_provider.name}")
+            logger.info(f"延迟初始化API客户端成功：{provider.name}")
             return True
 
         except Exception as e:
             logger.warning(f"延迟初始化API客户端失败：{e}")
-            self._lazy_initialized = True
             return False
 
     def save_config(self) -> bool:
         """Save API config to .env file"""
-        if not self.current_provider or not self.api_key:
+        provider = self.current_provider
+        if not provider or not self.api_key:
             return False
 
         try:
-            env_lines = []
-
-            # Read existing .env if present
-            if os.path.exists(ENV_FILE):
-                with open(ENV_FILE, "r", encoding="utf-8") as f:
-                    for line in f:
-                        # Skip API-related lines (will be rewritten)
-                        if not line.strip().startswith(
-                            (
-                                "API_PROVIDER=",
-                                "API_KEY=",
-                                "API_MODEL=",
-                                "API_SECRET_KEY=",
-                            )
-                        ):
-                            env_lines.append(line.rstrip())
-
-            # Add API config
-            env_lines.extend(
-                [
-                    "",
-                    "# API Configuration",
-                    f"API_PROVIDER={self.current_provider.provider_id}",
-                    f"API_KEY={self.api_key}",
-                    f"API_MODEL={self.model}",
-                ]
-            )
-
-            if self.current_provider.need_secret_key and self.secret_key:
+            env_lines = [
+                "# API Configuration",
+                f"API_PROVIDER={provider.provider_id}",
+                f"API_KEY={self.api_key}",
+                f"API_MODEL={self.model}",
+            ]
+            if provider.need_secret_key and self.secret_key:
                 env_lines.append(f"API_SECRET_KEY={self.secret_key}")
 
-            _write_text_atomic(ENV_FILE, "\n".join(env_lines) + "\n")
+            _rewrite_env_file(env_lines)
+            clear_env_cache()
 
             logger.info(f"API配置已保存到：{ENV_FILE}")
             return True
@@ -192,31 +423,36 @@ class UnifiedAPIClient:
     def clear_config(self):
         """Clear saved config from both .env and legacy JSON"""
         # Clear legacy JSON
+        _JSON_CACHE.pop(API_CONFIG_FILE, None)
+        clear_env_cache()
         if os.path.exists(API_CONFIG_FILE):
             os.remove(API_CONFIG_FILE)
 
         # Clear API vars from .env
         if os.path.exists(ENV_FILE):
             try:
-                with open(ENV_FILE, "r", encoding="utf-8") as f:
-                    lines = [
-                        line
-                        for line in f
-                        if not line.strip().startswith(
-                            (
-                                "API_PROVIDER=",
-                                "API_KEY=",
-                                "API_MODEL=",
-                                "API_SECRET_KEY=",
-                            )
-                        )
-                    ]
-                _write_text_atomic(ENV_FILE, "".join(lines))
+                _rewrite_env_file(())
             except Exception as e:
                 logger.warning(f"清除.env中API配置失败: {e}")
 
         logger.info("已清除API配置")
 
+    def close(self) -> None:
+        """Drop this instance's client; the next call lazily re-initializes it.
+
+        The pooled httpx client is process-wide and shared with other
+        instances, so it is only closed at exit (see close_http_client).
+        """
+        self.client = None
+        self.is_available = False
+        self._lazy_initialized = False
+
+    async def aclose(self) -> None:
+        """Release the running loop's async client and its pooled connections"""
+        aclient = self._aclients.pop(asyncio.get_running_loop(), None)
+        if aclient is not None:
+            await aclient.close()
+
     def get_saved_provider(self) -> Optional[str]:
         """Get saved provider ID"""
         if self.current_provider:
@@ -236,7 +472,7 @@ class UnifiedAPIClient:
             return False
 
         target_model = model or provider.default_model
-        if not self._test_connection(client, target_model, provider.name):
+        if not self._test_connection(client, target_model, provider):
             self.clear_config()
             return False
 
@@ -248,6 +484,8 @@ class UnifiedAPIClient:
     ):
         """Set active client state"""
         self.client = client
+        self._aclients.clear()
+        self.cache_clear()
         self.current_provider = provider
         self.api_key = api_key
         self.secret_key = secret_key
@@ -257,7 +495,8 @@ class UnifiedAPIClient:
 
     def _validate_credentials(self, provider_id: str, api_key: str, secret_key: str):
         """Validate provider and credentials"""
-        if provider_id not in API_PROVIDERS:
+        provider = API_PROVIDERS.get(provider_id)
+        if provider is None:
             logger.error(f"不支持的API提供商：{provider_id}")
             return None
 
@@ -265,7 +504,6 @@ class UnifiedAPIClient:
             logger.warning("API Key 不能为空")
             return None
 
-        provider = API_PROVIDERS[provider_id]
         if provider.need_secret_key and not secret_key:
             logger.warning(f"{provider.name} 需要 Secret Key")
             return None
@@ -274,30 +512,51 @@ class UnifiedAPIClient:
 
     def _create_client(self, provider, api_key: str, secret_key: str):
         """Create OpenAI client instance"""
-        try:
-            import openai
-        except ImportError:
+        openai = _import_openai()
+        if openai is None:
             logger.error("未安装 openai 库，请运行 `pip install openai>=1.0.0` 安装")
             return None
 
         try:
-            client_kwargs = {
-                "api_key": api_key,
-                "base_url": provider.base_url,
-                "timeout": self.timeout,
-            }
-
-            if provider.provider_id == "baidu" and secret_key:
-                client_kwargs["default_headers"] = {"X-Bce-Signature-Key": secret_key}
-
-            return openai.OpenAI(**client_kwargs)
+            return self._get_openai_client(openai, provider, api_key, secret_key)
         except Exception as e:
             logger.error(f"创建客户端失败：{e}")
             return None
 
-    def _test_connection(self, client, model: str, provider_name: str) -> bool:
-        """Test API connection with a simple call"""
+    def _get_openai_client(self, openai, provider, api_key: str, secret_key):
+        """Reuse one OpenAI client per (base_url, credentials, timeout)"""
+        key = (provider.base_url, api_key, secret_key, self.timeout)
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = openai.OpenAI(**self._client_kwargs(provider, api_key, secret_key))
+            # 并发首建时以先写入者为准（dict.setdefault 原子）
+            client = _CLIENT_CACHE.setdefault(key, client)
+        return client
+
+    def _client_kwargs(self, provider, api_key: str, secret_key: Optional[str]) -> dict:
+        """Build OpenAI client kwargs (shared by lazy init and initialize)"""
+        client_kwargs = {
+            "api_key": api_key,
+            "base_url": provider.base_url,
+            "timeout": self.timeout,
+            "http_client": _get_http_client(),
+        }
+        if provider.need_secret_key and secret_key:
+            client_kwargs["default_headers"] = {"X-Bce-Signature-Key": secret_key}
+        return client_kwargs
+
+    def _test_connection(self, client, model: str, provider) -> bool:
+        """Test API connection (GET /models; no tokens billed)"""
         try:
+            if provider.provider_id not in _COMPLETION_PING_PROVIDERS:
+                try:
+                    # 列表含目标模型即通过；不含（拼写错误或未开通）再用补全调用确认
+                    if model in {getattr(m, "id", None) for m in client.models.list()}:
+                        return True
+                except Exception as e:
+                    # 鉴权失败直接判定失败；其余（如接口不支持）再用补全调用确认
+                    if getattr(e, "status_code", None) in (401, 403):
+                        raise
             client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": "hi"}],
@@ -305,75 +564,254 @@ class UnifiedAPIClient:
             )
             return True
         except Exception as e:
-            logger.error(f"{provider_name} 配置失败：{e}")
+            logger.error(f"{provider.name} 配置失败：{e}")
             self.is_available = False
             return False
 
+    def _get_async_client(self):
+        """Lazily build the running loop's AsyncOpenAI client (batch generation)"""
+        loop = asyncio.get_running_loop()
+        aclient = self._aclients.get(loop)
+        if aclient is not None:
+            return aclient
+
+        openai = _import_openai()
+        if openai is None:
+            return None
+
+        try:
+            import httpx
+
+            client_kwargs = self._client_kwargs(
+                self.current_provider, self.api_key, self.secret_key
+            )
+            client_kwargs["http_client"] = httpx.AsyncClient(
+                verify=_get_ssl_context(),
+                timeout=self.timeout,
+                limits=httpx.Limits(**_HTTP_LIMITS),
+                http2=_HTTP2,
+            )
+            aclient = self._aclients[loop] = openai.AsyncOpenAI(**client_kwargs)
+        except Exception as e:
+            logger.warning(f"初始化异步API客户端失败：{e}")
+        return aclient
+
     def generate_followup(
         self, answer: str, topic: dict, conversation_log: list = None
     ) -> Optional[str]:
         """Generate intelligent followup question"""
-        if not self.is_available and not self._lazy_initialized:
-            self._lazy_init_client()
+        if not self._lazy_init_client():
+            return None
+
+        request = self._prepare_followup(answer, topic, conversation_log)
+        if request is None:
+            return None
+
+        key = self._followup_cache_key(request)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        return self._cache_put(key, self._call_with_retry(*request))
+
+    async def agenerate_followup(
+        self, answer: str, topic: dict, conversation_log: list = None
+    ) -> Optional[str]:
+        """Async generate_followup (AsyncOpenAI, non-blocking retries)"""
+        if not self._lazy_init_client():
+            return None
+        aclient = self._get_async_client()
+        if aclient is None:
+            return None
 
-        if not self.is_available or not self.client:
+        request = self._prepare_followup(answer, topic, conversation_log)
+        if request is None:
             return None
 
+        key = self._followup_cache_key(request)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        return self._cache_put(key, await self._acall_with_retry(aclient, *request))
+
+    async def generate_followup_batch(
+        self, items: Sequence[Tuple[str, dict]], conversation_log: list = None
+    ) -> list:
+        """Generate followups for several (answer, topic) pairs concurrently"""
+        if not items:
+            return []
+        return list(
+            await asyncio.gather(
+                *(self.agenerate_followup(a, t, conversation_log) for a, t in items)
+            )
+        )
+
+    def _followup_cache_key(self, request) -> tuple:
+        """Cache key: model + full user prompt (answer, topic and history)"""
+        return (self.model, request[0][1]["content"])
+
+    def _cache_get(self, key: tuple) -> Optional[str]:
+        with self._followup_cache_lock:
+            value = self._followup_cache.get(key)
+            if value is not None:
+                self._followup_cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key: tuple, value: Optional[str]) -> Optional[str]:
+        """Remember successful results only; failures are retried next time"""
+        if value is None:
+            return None
+        with self._followup_cache_lock:
+            self._followup_cache[key] = value
+            self._followup_cache.move_to_end(key)
+            if len(self._followup_cache) > _FOLLOWUP_CACHE_SIZE:
+                self._followup_cache.popitem(last=False)
+        return value
+
+    def cache_clear(self) -> None:
+        """Drop cached followup results"""
+        with self._followup_cache_lock:
+            self._followup_cache.clear()
+
+    @staticmethod
+    def _prepare_followup(answer: str, topic: dict, conversation_log: list = None):
+        """Build (messages, original_question, preset_follows), or None if too short"""
         valid_answer = answer.strip()
         if len(valid_answer) < 2:
             return None
 
+        original_question = topic.get("questions", [""])[0]
         prompt = PromptBuilder.build_followup_prompt(
-            valid_answer, topic, conversation_log
+            valid_answer, topic, conversation_log, original_question=original_question
         )
-        return self._call_with_retry(prompt, topic)
+        messages = [_SYSTEM_MESSAGE, {"role": "user", "content": prompt.strip()}]
+        preset_follows = frozenset(topic.get("followups", ()))
+        return messages, original_question, preset_follows
 
-    def _call_with_retry(self, prompt: str, topic: dict) -> Optional[str]:
+    def _call_with_retry(
+        self, messages: list, original_question: str, preset_follows
+    ) -> Optional[str]:
         """API call with retry mechanism"""
         last_error = None
+        stream = self._should_stream()
 
         for attempt in range(self.max_retries):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 response = self.client.chat.completions.create(
                     model=self.model,
-                    messages=[
-                        {"role": "system", "content": FOLLOWUP_SYSTEM_PROMPT},
-                        {"role": "user", "content": prompt.strip()},
-                    ],
+                    messages=messages,
                     max_tokens=MAX_FOLLOWUP_TOKENS,
                     temperature=0.7,
                     n=1,
+                    stream=stream,
                 )
-
-                elapsed_ms = int((time.time() - start_time) * 1000)
-                logger.log_api_call("generate_followup", True, elapsed_ms / 1000)
-                logger.info(
-                    f"API调用成功: {self.current_provider.name}",
-                    extra={
-                        "provider": self.current_provider.name,
-                        "model": self.model,
-                        "elapsed_ms": elapsed_ms,
-                    },
-                )
+                if stream:
+                    with contextlib.closing(response):
+                        content = _collect_stream(response)
+                    duration = self._log_attempt_success(start_ns)
+                    return ResponseParser.parse_followup_text(
+                        content, original_question, preset_follows, duration
+                    )
+
+                duration = self._log_attempt_success(start_ns)
                 return ResponseParser.extract_followup(
-                    response, topic, elapsed_ms / 1000
+                    response, original_question, preset_follows, duration
                 )
 
             except Exception as e:
-                elapsed_ms = int((time.time() - start_time) * 1000)
                 last_error = str(e)
-                logger.log_api_call(
-                    "generate_followup",
-                    False,
-                    elapsed_ms / 1000,
-                    f"第{attempt + 1}次尝试失败: {last_error[:50]}",
+                wait_time = self._log_attempt_failure(attempt, start_ns, last_error)
+                if wait_time:
+                    time.sleep(wait_time)
+
+        logger.error(f"API调用失败，已重试{self.max_retries}次: {last_error}")
+        return None
+
+    async def _acall_with_retry(
+        self, aclient, messages: list, original_question: str, preset_follows
+    ) -> Optional[str]:
+        """Async API call with retry mechanism (non-blocking backoff)"""
+        last_error = None
+        stream = self._should_stream()
+
+        for attempt in range(self.max_retries):
+            start_ns = time.perf_counter_ns()
+            try:
+                response = await aclient.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=MAX_FOLLOWUP_TOKENS,
+                    temperature=0.7,
+                    n=1,
+                    stream=stream,
+                )
+                if stream:
+                    try:
+                        content = await _acollect_stream(response)
+                    finally:
+                        await response.close()
+                    duration = self._log_attempt_success(start_ns)
+                    return ResponseParser.parse_followup_text(
+                        content, original_question, preset_follows, duration
+                    )
+
+                duration = self._log_attempt_success(start_ns)
+                return ResponseParser.extract_followup(
+                    response, original_question, preset_follows, duration
                 )
 
-                if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (2**attempt)
-                    logger.debug(f"等待 {wait_time:.1f}s 后重试...")
-                    time.sleep(wait_time)
+            except Exception as e:
+                last_error = str(e)
+                wait_time = self._log_attempt_failure(attempt, start_ns, last_error)
+                if wait_time:
+                    await asyncio.sleep(wait_time)
 
         logger.error(f"API调用失败，已重试{self.max_retries}次: {last_error}")
         return None
+
+    def _should_stream(self) -> bool:
+        """Stream unless the model is a reasoning model (see markers above)"""
+        return not any(m in (self.model or "") for m in _REASONING_MODEL_MARKERS)
+
+    def _backoff_table(self) -> tuple:
+        """Per-attempt backoff caps, rebuilt only when retry settings change"""
+        params = (self.retry_delay, self.max_retries)
+        if self._backoff_params != params:
+            self._backoff = tuple(
+                self.retry_delay * (1 << i) for i in range(self.max_retries)
+            )
+            self._backoff_params = params
+        return self._backoff
+
+    def _log_attempt_success(self, start_ns: int) -> float:
+        """Log a successful attempt; returns its duration in seconds"""
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        logger.log_api_call("generate_followup", True, elapsed_ms / 1000)
+        logger.info(
+            f"API调用成功: {self.current_provider.name}",
+            extra={
+                "provider": self.current_provider.name,
+                "model": self.model,
+                "elapsed_ms": elapsed_ms,
+            },
+        )
+        return elapsed_ms / 1000
+
+    def _log_attempt_failure(
+        self, attempt: int, start_ns: int, error: str
+    ) -> Optional[float]:
+        """Log a failed attempt; returns the backoff before the next one, if any"""
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        logger.log_api_call(
+            "generate_followup",
+            False,
+            elapsed_ms / 1000,
+            f"第{attempt + 1}次尝试失败: {error[:50]}",
+        )
+
+        if attempt >= self.max_retries - 1:
+            return None
+        # 指数退避 + full jitter：并发请求被限流时不会同步重试
+        wait_time = random.uniform(0, self._backoff_table()[attempt])
+        logger.debug(f"等待 {wait_time:.1f}s 后重试...")
+        return wait_time
@@ -2,23 +2,29 @@
 # coding: utf-8
 """API Helper Functions - Global instance and convenience wrappers"""
 
-from typing import Dict, Optional
+import threading
+from typing import Mapping, Optional, Sequence, Tuple
 
 from interview_system.integrations.api_providers import API_PROVIDERS, APIProviderConfig
 from interview_system.integrations.api_client import UnifiedAPIClient
 
 _api_client: Optional[UnifiedAPIClient] = None
+_api_client_lock = threading.Lock()
 
 
 def get_api_client() -> UnifiedAPIClient:
-    """Get global API client instance"""
+    """Get global API client instance (double-checked locking)"""
     global _api_client
-    if _api_client is None:
-        _api_client = UnifiedAPIClient()
-    return _api_client
+    client = _api_client
+    if client is None:
+        with _api_client_lock:
+            if _api_client is None:
+                _api_client = UnifiedAPIClient()
+            client = _api_client
+    return client
 
 
-def get_available_providers() -> Dict[str, APIProviderConfig]:
+def get_available_providers() -> Mapping[str, APIProviderConfig]:
     """Get all available API providers"""
     return API_PROVIDERS
 
@@ -37,6 +43,20 @@ def generate_followup(
     return get_api_client().generate_followup(answer, topic, conversation_log)
 
 
+async def agenerate_followup(
+    answer: str, topic: dict, conversation_log: list = None
+) -> Optional[str]:
+    """Generate intelligent followup without blocking the event loop"""
+    return await get_api_client().agenerate_followup(answer, topic, conversation_log)
+
+
+async def generate_followup_batch(
+    items: Sequence[Tuple[str, dict]], conversation_log: list = None
+) -> list:
+    """Generate followups for several (answer, topic) pairs concurrently"""
+    return await get_api_client().generate_followup_batch(items, conversation_log)
+
+
 def is_api_available() -> bool:
     """Check if API is available"""
     return get_api_client().is_available
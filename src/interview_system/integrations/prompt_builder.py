@@ -2,20 +2,33 @@
 # coding: utf-8
 """Prompt Builder - Constructs prompts for followup generation"""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Mapping, Optional, Tuple, Union
 
 from interview_system.integrations.prompt_templates import (
+    DEFAULT_TONE,
     FOLLOWUP_USER_TEMPLATE,
     TONE_MAP,
 )
 
 
+@lru_cache(maxsize=256)
+def _split_topic_name(topic_name: str) -> Tuple[str, str]:
+    """Split "场景-五育" once per distinct topic name (the catalog is small)"""
+    scene, sep, edu_type = topic_name.partition("-")
+    return (scene, edu_type) if sep else ("", "")
+
+
 class PromptBuilder:
     """Builds prompts for followup question generation"""
 
     @staticmethod
     def build_followup_prompt(
-        answer: str, topic: dict, conversation_log: list = None
+        answer: str,
+        topic: dict,
+        conversation_log: list = None,
+        *,
+        original_question: Optional[str] = None,
     ) -> str:
         """
         Build prompt for followup generation
@@ -23,42 +36,58 @@ class PromptBuilder:
         Args:
             answer: User's answer
             topic: Current topic dict
-            conversation_log: Conversation history
+            conversation_log: Conversation history, or its index_by_topic() mapping
+            original_question: Core question, if the caller already resolved it
 
         Returns:
             Formatted prompt string
         """
         topic_name = topic.get("name", "")
-        scene, edu_type = topic_name.split("-", 1) if "-" in topic_name else ("", "")
-        original_question = topic.get("questions", [""])[0]
+        scene, edu_type = _split_topic_name(topic_name)
+        if original_question is None:
+            original_question = topic.get("questions", [""])[0]
 
         history_context = PromptBuilder._build_history_context(
             conversation_log, topic_name
         )
-        tone_guide = TONE_MAP.get(edu_type, "专业而亲和，像记者采访一样")
-
-        return FOLLOWUP_USER_TEMPLATE.format(
-            edu_type=edu_type,
-            scene=scene,
-            original_question=original_question,
-            history_context=history_context,
-            answer=answer,
-            tone_guide=tone_guide,
+        tone_guide = TONE_MAP.get(edu_type, DEFAULT_TONE)
+
+        return FOLLOWUP_USER_TEMPLATE.format_map(
+            {
+                "edu_type": edu_type,
+                "scene": scene,
+                "original_question": original_question,
+                "history_context": history_context,
+                "answer": answer,
+                "tone_guide": tone_guide,
+            }
         )
 
+    @staticmethod
+    def index_by_topic(conversation_log: Optional[list]) -> dict:
+        """Group logs by topic name once (reuse across many followup prompts)"""
+        index: dict = {}
+        for log in conversation_log or ():
+            index.setdefault(log.get("topic"), []).append(log)
+        return index
+
     @staticmethod
     def _build_history_context(
-        conversation_log: Optional[list], topic_name: str
+        conversation_log: Union[list, Mapping, None], topic_name: str
     ) -> str:
         """Build conversation history context"""
         if not conversation_log:
             return ""
 
-        topic_logs = [log for log in conversation_log if log.get("topic") == topic_name]
-        if not topic_logs:
-            return ""
+        if isinstance(conversation_log, Mapping):
+            topic_logs = conversation_log.get(topic_name, ())
+        else:
+            topic_logs = (
+                log for log in conversation_log if log.get("topic") == topic_name
+            )
 
         history_parts = []
+        followup_idx = 0
         for log in topic_logs:
             q_type = log.get("question_type", "")
             q_text = log.get("question", "")
@@ -67,9 +96,8 @@ class PromptBuilder:
             if "核心" in q_type:
                 history_parts.append(f"【核心问题】{q_text}\n【回答】{ans}")
             elif "追问" in q_type:
-                history_parts.append(
-                    f"【追问{len(history_parts)}】{q_text}\n【回答】{ans}"
-                )
+                followup_idx += 1
+                history_parts.append(f"【追问{followup_idx}】{q_text}\n【回答】{ans}")
 
         if history_parts:
             return "\n\n【对话历史】\n" + "\n\n".join(history_parts)
@@ -2,6 +2,8 @@
 # coding: utf-8
 """Prompt templates for followup generation"""
 
+from types import MappingProxyType
+
 FOLLOWUP_SYSTEM_PROMPT = """你是一位专业的访谈记者，正在进行大学生五育发展主题访谈。你的追问要紧扣访谈主题，专业而有深度。只输出追问问题本身，不要有任何前缀、解释或多余内容。"""
 
 FOLLOWUP_USER_TEMPLATE = """你是一位专业的访谈记者，正在对大学生进行关于"五育并举"主题的深度访谈。
@@ -32,10 +34,14 @@ FOLLOWUP_USER_TEMPLATE = """你是一位专业的访谈记者，正在对大学
 
 直接输出追问问题，不要任何前缀或解释。"""
 
-TONE_MAP = {
-    "德育": "正式而有深度，关注价值观和道德判断。示例：'您认为这个经历对您的价值观产生了怎样的影响？'",
-    "智育": "理性而专业，关注学习过程和思维发展。示例：'这种学习方法对您的思维能力有什么具体帮助？'",
-    "体育": "务实而积极，关注身体素质和运动习惯。示例：'坚持这项运动对您的身心状态有什么改变？'",
-    "美育": "细腻而有感染力，关注审美体验和艺术感悟。示例：'这次艺术体验让您对美有了什么新的认识？'",
-    "劳育": "朴实而真诚，关注实践能力和劳动价值。示例：'这次劳动经历让您对动手实践有了什么新的理解？'",
-}
+TONE_MAP = MappingProxyType(
+    {
+        "德育": "正式而有深度，关注价值观和道德判断。示例：'您认为这个经历对您的价值观产生了怎样的影响？'",
+        "智育": "理性而专业，关注学习过程和思维发展。示例：'这种学习方法对您的思维能力有什么具体帮助？'",
+        "体育": "务实而积极，关注身体素质和运动习惯。示例：'坚持这项运动对您的身心状态有什么改变？'",
+        "美育": "细腻而有感染力，关注审美体验和艺术感悟。示例：'这次艺术体验让您对美有了什么新的认识？'",
+        "劳育": "朴实而真诚，关注实践能力和劳动价值。示例：'这次劳动经历让您对动手实践有了什么新的理解？'",
+    }
+)
+
+DEFAULT_TONE = "专业而亲和，像记者采访一样"
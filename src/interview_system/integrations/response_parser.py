@@ -2,22 +2,30 @@
 # coding: utf-8
 """Response Parser - Extracts and validates followup questions from API responses"""
 
+import re
 from typing import Optional
 
 import interview_system.common.logger as logger
 
+_PREFIX_RE = re.compile(r"^(?:\*\*追问\*\*|追问|问)[:：]")
+_QUOTE_PAIRS = (('"', '"'), ("“", "”"))
+_REASONING_SKIP_PREFIXES = ("<", "【", "```")
+
 
 class ResponseParser:
     """Parses and validates API responses for followup questions"""
 
     @staticmethod
-    def extract_followup(response, topic: dict, duration: float) -> Optional[str]:
+    def extract_followup(
+        response, original_question: str, preset_follows, duration: float
+    ) -> Optional[str]:
         """
         Extract followup question from API response
 
         Args:
             response: API response object
-            topic: Current topic dict
+            original_question: Core question of the current topic
+            preset_follows: Preset followups (a frozenset for O(1) membership)
             duration: API call duration
 
         Returns:
@@ -28,15 +36,28 @@ class ResponseParser:
             return None
 
         choice = response.choices[0]
-        follow_question = ResponseParser._extract_content(choice)
+        return ResponseParser.parse_followup_text(
+            ResponseParser._extract_content(choice),
+            original_question,
+            preset_follows,
+            duration,
+        )
 
+    @staticmethod
+    def parse_followup_text(
+        follow_question: str, original_question: str, preset_follows, duration: float
+    ) -> Optional[str]:
+        """Clean and validate followup text (e.g. collected from a stream)"""
+        follow_question = follow_question.strip()
         if not follow_question:
             logger.log_api_call("generate_followup", True, duration, "API返回内容为空")
             return None
 
         follow_question = ResponseParser._clean_followup(follow_question)
 
-        if not ResponseParser._validate_followup(follow_question, topic):
+        if not ResponseParser._validate_followup(
+            follow_question, original_question, preset_follows
+        ):
             logger.log_api_call(
                 "generate_followup",
                 True,
@@ -52,18 +73,19 @@ class ResponseParser:
     @staticmethod
     def _extract_content(choice) -> str:
         """Extract content from choice"""
-        if not hasattr(choice, "message") or not choice.message:
+        try:
+            message = choice.message
+            content = message.content
+        except AttributeError:
             return ""
 
-        if hasattr(choice.message, "content") and choice.message.content:
-            return choice.message.content.strip()
-
-        if hasattr(choice.message, "reasoning_content"):
-            return ResponseParser._extract_from_reasoning(
-                choice.message.reasoning_content
-            )
+        if content:
+            return content.strip()
 
-        return ""
+        reasoning = getattr(message, "reasoning_content", None)
+        if not reasoning:
+            return ""
+        return ResponseParser._extract_from_reasoning(reasoning)
 
     @staticmethod
     def _extract_from_reasoning(reasoning: str) -> str:
@@ -71,36 +93,36 @@ class ResponseParser:
         if not reasoning:
             return ""
 
-        lines = reasoning.strip().split("\n")
-        for line in reversed(lines):
-            line = line.strip()
-            if line and len(line) >= 5 and not line.startswith(("<", "【", "```")):
+        # 从尾部逐行回扫，只切出实际检查到的行（推理内容可能很长）
+        end = len(reasoning)
+        while end > 0:
+            start = reasoning.rfind("\n", 0, end) + 1
+            line = reasoning[start:end].strip()
+            if len(line) >= 5 and not line.startswith(_REASONING_SKIP_PREFIXES):
                 return line
+            end = start - 1
 
         return ""
 
     @staticmethod
     def _clean_followup(text: str) -> str:
         """Clean followup text"""
-        prefixes = ["追问：", "追问:", "问：", "问:", "**追问**：", "**追问**:"]
-        for prefix in prefixes:
-            if text.startswith(prefix):
-                text = text[len(prefix) :].strip()
+        match = _PREFIX_RE.match(text)
+        if match:
+            text = text[match.end() :].strip()
 
-        if text.startswith('"') and text.endswith('"'):
-            text = text[1:-1].strip()
-        if text.startswith('"') and text.endswith('"'):
-            text = text[1:-1].strip()
+        for left, right in _QUOTE_PAIRS:
+            if text.startswith(left) and text.endswith(right):
+                text = text[1:-1].strip()
 
         return text
 
     @staticmethod
-    def _validate_followup(followup: str, topic: dict) -> bool:
-        """Validate followup quality"""
-        if not followup or len(followup) < 5:
+    def _validate_followup(
+        followup: str, original_question: str, preset_follows
+    ) -> bool:
+        """Validate followup quality (rejects echoes/fragments of the question)"""
+        if len(followup) < 5:
             return False
 
-        preset_follows = topic.get("followups", [])
-        original_question = topic.get("questions", [""])[0]
-
         return followup not in original_question and followup not in preset_follows
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from fastapi.testclient import TestClient
 
 from interview_system.api.main import create_app
@@ -74,3 +76,23 @@ def test_admin_overview_search_and_export():
         )
         assert export_json.status_code == 200
         assert export_json.headers.get("content-type", "").startswith("application/json")
+        exported = export_json.json()
+        assert isinstance(exported, list) and len(exported) >= 1
+        assert "session_id" in exported[0]
+        # 流式导出与一次性 json.dumps(indent=2) 的输出逐字节一致
+        assert export_json.text == json.dumps(exported, ensure_ascii=False, indent=2)
+
+        export_sessions = client.get(
+            "/api/admin/export?format=json&scope=sessions&limit=100",
+            headers=headers,
+        )
+        assert export_sessions.status_code == 200
+        sessions = export_sessions.json()
+        assert [s["session_id"] for s in sessions] == [session_id]
+        assert isinstance(sessions[0]["selected_topics"], list)
+
+        export_empty = client.get(
+            "/api/admin/export?format=json&scope=sessions&user_name=nobody",
+            headers=headers,
+        )
+        assert export_empty.text == "[]"
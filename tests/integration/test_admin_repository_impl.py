@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from interview_system.domain.entities import Session
+from interview_system.domain.value_objects.conversation_entry import ConversationEntry
+from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.repositories import (
+    AdminRepositoryImpl,
+    SessionRepositoryImpl,
+)
+
+
+def _entry(ts: datetime, depth: int, topic: str = "学校-德育") -> ConversationEntry:
+    return ConversationEntry(
+        timestamp=ts,
+        topic=topic,
+        question_type="核心问题",
+        question="Q",
+        answer="A",
+        depth_score=depth,
+    )
+
+
+@pytest.mark.asyncio
+async def test_admin_time_series_merges_session_and_log_buckets():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    sessions = SessionRepositoryImpl(db)
+    day1 = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+    day2 = datetime(2026, 1, 2, 9, tzinfo=timezone.utc)
+    day3 = datetime(2026, 1, 3, 9, tzinfo=timezone.utc)
+
+    a = Session(user_name="alice", created_at=day1)
+    b = Session(user_name="bob", created_at=day1)
+    c = Session(user_name="alice", created_at=day3)
+    for s in (a, b, c):
+        await sessions.save(s)
+    await sessions.append_conversation_entries(
+        a.id, [_entry(day1, 2), _entry(day2, 4), _entry(day2, 2)]
+    )
+
+    repo = AdminRepositoryImpl(db)
+    points = await repo.get_time_series(start=None, end=None, bucket="day")
+
+    assert [p.bucket for p in points] == ["2026-01-01", "2026-01-02", "2026-01-03"]
+    assert [p.sessions for p in points] == [2, 0, 1]
+    assert [p.unique_users for p in points] == [2, 0, 1]
+    assert [p.messages for p in points] == [1, 2, 0]
+    assert [p.avg_depth_score for p in points] == [2.0, 3.0, 0.0]
+
+    ranged = await repo.get_time_series(start=day2, end=day3, bucket="day")
+    assert [(p.bucket, p.sessions, p.messages) for p in ranged] == [
+        ("2026-01-02", 0, 2)
+    ]
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_admin_distribution_groups_by_scene_and_edu_type():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    sessions = SessionRepositoryImpl(db)
+    ts = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+    s = Session(user_name="alice", created_at=ts)
+    await sessions.save(s)
+    await sessions.append_conversation_entries(
+        s.id,
+        [
+            _entry(ts, 1, "学校-德育"),
+            _entry(ts, 3, "学校-德育"),
+            _entry(ts, 2, "家庭-劳育"),
+            _entry(ts, 0, "无分类"),
+        ],
+    )
+
+    rows = await AdminRepositoryImpl(db).get_distribution(start=None, end=None)
+    assert [(r.scene, r.edu_type, r.messages, r.avg_depth_score) for r in rows] == [
+        ("学校", "德育", 2, 2.0),
+        ("家庭", "劳育", 1, 2.0),
+    ]
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_admin_shared_session_checks_out_one_connection():
+    from sqlalchemy import event
+
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    checkouts: list[object] = []
+    event.listen(db.engine.sync_engine, "checkout", lambda *args: checkouts.append(1))
+
+    repo = AdminRepositoryImpl(db)
+    async with repo.shared_session():
+        await repo.get_time_series(start=None, end=None, bucket="day")
+        await repo.get_user_activity(start=None, end=None, limit=10)
+        await repo.get_top_topics(start=None, end=None, limit=10)
+        await repo.get_distribution(start=None, end=None)
+    assert len(checkouts) == 1
+
+    checkouts.clear()
+    await repo.get_top_topics(start=None, end=None, limit=10)
+    await repo.get_distribution(start=None, end=None)
+    assert len(checkouts) == 2
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_admin_search_keyword_matches_wildcards_literally():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    sessions = SessionRepositoryImpl(db)
+    ts = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+    s = Session(user_name="alice", created_at=ts)
+    await sessions.save(s)
+    await sessions.append_conversation_entries(s.id, [_entry(ts, 1), _entry(ts, 2)])
+
+    repo = AdminRepositoryImpl(db)
+    total, rows = await repo.search_conversations(
+        start=None,
+        end=None,
+        user_name=None,
+        topic=None,
+        keyword="%",
+        min_depth=None,
+        max_depth=None,
+        limit=10,
+        offset=0,
+    )
+    assert total == 0
+    assert rows == []
+
+    total, rows = await repo.search_conversations(
+        start=None,
+        end=None,
+        user_name=None,
+        topic=None,
+        keyword="a",
+        min_depth=None,
+        max_depth=None,
+        limit=1,
+        offset=1,
+    )
+    assert total == 2
+    assert len(rows) == 1
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_admin_log_count_tracks_inserts_and_deletes():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    sessions = SessionRepositoryImpl(db)
+    ts = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+    a = Session(user_name="alice", created_at=ts)
+    b = Session(user_name="bob", created_at=ts)
+    await sessions.save(a, new_entries=(_entry(ts, 1),))
+    await sessions.save(b)
+    await sessions.append_conversation_entries(a.id, [_entry(ts, 1), _entry(ts, 2)])
+    await sessions.append_conversation_entries(b.id, [_entry(ts, 1)])
+    await sessions.delete_last_conversation_entry(a.id)
+
+    repo = AdminRepositoryImpl(db)
+    _total, rows = await repo.list_sessions(
+        start=None, end=None, user_name=None, is_finished=None, limit=10, offset=0
+    )
+    assert {r.user_name: r.log_count for r in rows} == {"alice": 2, "bob": 1}
+
+    activity = await repo.get_user_activity(start=None, end=None, limit=10)
+    assert [(u.user_name, u.sessions, u.messages) for u in activity] == [
+        ("alice", 1, 2),
+        ("bob", 1, 1),
+    ]
+    ranged = await repo.get_user_activity(
+        start=ts, end=datetime(2026, 1, 2, tzinfo=timezone.utc), limit=10
+    )
+    assert [(u.user_name, u.messages) for u in ranged] == [("alice", 2), ("bob", 1)]
+
+    await db.dispose()
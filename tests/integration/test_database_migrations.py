@@ -25,3 +25,115 @@ async def test_migrations_create_tables_and_columns():
     assert "answer" in columns2
 
     await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_file_database_uses_wal_and_tuned_pragmas(tmp_path):
+    db = AsyncDatabase(f"sqlite+aiosqlite:///{tmp_path / 'interview.db'}")
+    await db.init()
+
+    assert (await db.execute("PRAGMA journal_mode")).scalar() == "wal"
+    assert (await db.execute("PRAGMA synchronous")).scalar() == 1  # NORMAL
+    assert (await db.execute("PRAGMA temp_store")).scalar() == 2  # MEMORY
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_conversation_logs_use_composite_session_index():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    result = await db.execute("PRAGMA index_list(conversation_logs)")
+    indexes = {row[1] for row in result.fetchall()}  # row[1] = name
+    assert "idx_session_id_id" in indexes
+    assert "ix_conversation_logs_session_id" not in indexes
+
+    plan = await db.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM conversation_logs "
+        "WHERE session_id = 'x' ORDER BY id DESC LIMIT 1"
+    )
+    details = " ".join(str(row[-1]) for row in plan.fetchall())
+    assert "idx_session_id_id" in details
+    assert "TEMP B-TREE" not in details
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_migrations_backfill_scene_and_edu_type_on_legacy_logs(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE sessions (
+            session_id TEXT PRIMARY KEY, user_name TEXT NOT NULL,
+            start_time TEXT NOT NULL, end_time TEXT, is_finished INTEGER NOT NULL,
+            current_question_idx INTEGER NOT NULL, selected_topics TEXT,
+            created_at TEXT, updated_at TEXT
+        );
+        CREATE TABLE conversation_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT,
+            timestamp TEXT NOT NULL, topic TEXT NOT NULL, question_type TEXT NOT NULL,
+            question TEXT NOT NULL, answer TEXT NOT NULL, depth_score INTEGER NOT NULL,
+            is_ai_generated INTEGER NOT NULL, created_at TEXT
+        );
+        INSERT INTO conversation_logs
+            (session_id, timestamp, topic, question_type, question, answer,
+             depth_score, is_ai_generated)
+        VALUES ('s1', '2026-01-01 00:00:00', '社区-美育', '核心问题', 'Q', 'A', 1, 0);
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    db = AsyncDatabase(f"sqlite+aiosqlite:///{path}")
+    await db.init()
+
+    row = (await db.execute("SELECT scene, edu_type FROM conversation_logs")).one()
+    assert tuple(row) == ("社区", "美育")
+
+    result = await db.execute("PRAGMA table_info(sessions)")
+    assert "version" in {row[1] for row in result.fetchall()}
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_migrations_stamp_user_version_and_always_ensure_indexes(tmp_path):
+    from interview_system.infrastructure.database.migrations import SCHEMA_VERSION
+
+    db = AsyncDatabase(f"sqlite+aiosqlite:///{tmp_path / 'interview.db'}")
+    await db.init()
+    assert (await db.execute("PRAGMA user_version")).scalar() == SCHEMA_VERSION
+
+    # 已是最新版本时只跳过补列/回填；缺失的索引仍会被重建
+    await db.execute("DROP INDEX idx_topic")
+    await db.init()
+    result = await db.execute("PRAGMA index_list(conversation_logs)")
+    assert "idx_topic" in {row[1] for row in result.fetchall()}
+    assert (await db.execute("PRAGMA user_version")).scalar() == SCHEMA_VERSION
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_distribution_grouping_index_covers_scene_edu_depth():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    result = await db.execute("PRAGMA index_info(idx_scene_edu_depth)")
+    columns = [row[2] for row in result.fetchall()]  # row[2] = name
+    assert columns == ["scene", "edu_type", "depth_score"]
+
+    plan = await db.execute(
+        "EXPLAIN QUERY PLAN SELECT scene, edu_type, COUNT(*), AVG(depth_score) "
+        "FROM conversation_logs WHERE scene != '' "
+        "GROUP BY scene, edu_type ORDER BY scene, edu_type"
+    )
+    details = " ".join(str(row[-1]) for row in plan.fetchall())
+    assert "idx_scene_edu_depth" in details
+
+    await db.dispose()
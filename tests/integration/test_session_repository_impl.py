@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 
 import pytest
@@ -54,3 +55,283 @@ async def test_session_repository_save_get_delete_and_logs():
     assert await repo.get(session.id) is None
 
     await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_save_appends_new_entries_in_same_transaction():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    repo = SessionRepositoryImpl(db)
+
+    session = Session(user_name="tester")
+    entry = ConversationEntry(
+        timestamp=datetime.now(timezone.utc),
+        topic="学校-德育",
+        question_type="核心问题",
+        question="Q1",
+        answer="A1",
+    )
+    await repo.save(session, new_entries=(entry,))
+
+    session.current_question_idx = 1
+    await repo.save(session)
+
+    entries = await repo.list_conversation_entries(session.id)
+    assert [e.answer for e in entries] == ["A1"]
+
+    loaded = await repo.get(session.id)
+    assert loaded is not None
+    assert loaded.current_question_idx == 1
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_append_conversation_entries_bulk():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    repo = SessionRepositoryImpl(db)
+    session = Session(user_name="tester")
+    await repo.save(session)
+
+    entries = [
+        ConversationEntry(
+            timestamp=datetime.now(timezone.utc),
+            topic="学校-德育",
+            question_type="核心问题",
+            question=f"Q{i}",
+            answer=f"A{i}",
+            depth_score=i,
+        )
+        for i in range(5)
+    ]
+    await repo.append_conversation_entries(session.id, entries)
+    await repo.append_conversation_entries(session.id, [])
+
+    loaded = await repo.list_conversation_entries(session.id)
+    assert [e.answer for e in loaded] == [f"A{i}" for i in range(5)]
+    assert [e.depth_score for e in loaded] == list(range(5))
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_loaded_topics_are_independent_lists():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    repo = SessionRepositoryImpl(db)
+    session = Session(user_name="tester")
+    session.selected_topics = [
+        {"name": "学校-德育", "scene": "学校", "edu_type": "德育", "questions": ["Q1"]}
+    ]
+    await repo.save(session)
+
+    first = await repo.get(session.id)
+    second = await repo.get(session.id)
+    assert first is not None and second is not None
+    assert first.selected_topics == second.selected_topics
+
+    first.selected_topics.append({"name": "extra"})
+    first.selected_topics[0]["questions"].append("Q2")
+    assert second.selected_topics == [
+        {"name": "学校-德育", "scene": "学校", "edu_type": "德育", "questions": ["Q1"]}
+    ]
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_save_stamps_one_time_per_transaction():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    repo = SessionRepositoryImpl(db)
+
+    session = Session(user_name="tester")
+    entry = ConversationEntry(
+        timestamp=datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+        topic="学校-德育",
+        question_type="核心问题",
+        question="Q1",
+        answer="A1",
+    )
+    await repo.save(session, new_entries=(entry,))
+
+    row = (
+        await db.execute(
+            "SELECT s.updated_at, l.created_at, l.timestamp FROM sessions s "
+            "JOIN conversation_logs l ON l.session_id = s.session_id"
+        )
+    ).one()
+    assert row[0] == row[1]
+    assert row[2] == "2024-01-02 03:04:05"
+
+    entries = await repo.list_conversation_entries(session.id)
+    assert entries[0].timestamp == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_round_trips_full_topic_dicts():
+    from interview_system.core.questions import TOPICS
+
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    repo = SessionRepositoryImpl(db)
+
+    custom = {"name": "自定义", "questions": ["Q"]}
+    session = Session(user_name="tester")
+    session.selected_topics = [TOPICS[0], custom]
+    await repo.save(session)
+
+    raw = (await db.execute("SELECT selected_topics FROM sessions")).scalar_one()
+    assert json.loads(raw) == [TOPICS[0], custom]
+
+    loaded = await repo.get(session.id)
+    assert loaded is not None
+    assert loaded.selected_topics == [TOPICS[0], custom]
+    assert loaded.selected_topics[0] is not TOPICS[0]
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_cache_revalidates_against_database():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    # 两个仓储各自持有缓存，模拟多个 worker 进程
+    repo_a = SessionRepositoryImpl(db, cache=SessionCache())
+    repo_b = SessionRepositoryImpl(db, cache=SessionCache())
+
+    session = Session(user_name="tester")
+    await repo_a.save(session)
+
+    first = await repo_a.get(session.id)
+    again = await repo_a.get(session.id)
+    assert again == first and again is not first
+
+    # 调用方修改返回的会话不会污染缓存
+    again.current_question_idx = 5
+    again.selected_topics.append({"name": "extra"})
+    cached = await repo_a.get(session.id)
+    assert cached is not None
+    assert cached.current_question_idx == 0
+    assert cached.selected_topics == []
+
+    other = await repo_b.get(session.id)
+    assert other is not None
+    other.current_question_idx = 1
+    await repo_b.save(other)
+
+    fresh = await repo_a.get(session.id)
+    assert fresh is not None
+    assert fresh.current_question_idx == 1
+
+    # 同一秒内只翻转标志位的写入也必须使其他缓存失效
+    fresh.is_followup = True
+    fresh.current_followup_question = "追问"
+    await repo_a.save(fresh)
+    flipped = await repo_b.get(session.id)
+    assert flipped is not None
+    assert flipped.is_followup
+    assert flipped.current_followup_question == "追问"
+
+    assert await repo_b.delete(session.id)
+    assert await repo_a.get(session.id) is None
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_delete_conversation_entries_last_n_and_all():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    repo = SessionRepositoryImpl(db)
+    session = Session(user_name="tester")
+    other = Session(user_name="other")
+    await repo.save(session)
+    await repo.save(other)
+
+    def _entry(answer: str) -> ConversationEntry:
+        return ConversationEntry(
+            timestamp=datetime.now(timezone.utc),
+            topic="学校-德育",
+            question_type="核心问题",
+            question="Q",
+            answer=answer,
+        )
+
+    await repo.append_conversation_entries(
+        session.id, [_entry(f"A{i}") for i in range(5)]
+    )
+    await repo.append_conversation_entries(other.id, [_entry("B")])
+
+    assert await repo.delete_conversation_entries(session.id, last_n=0) == 0
+    assert await repo.delete_conversation_entries(session.id, last_n=2) == 2
+    entries = await repo.list_conversation_entries(session.id)
+    assert [e.answer for e in entries] == ["A0", "A1", "A2"]
+
+    # 超过现有条数时删除全部
+    assert await repo.delete_conversation_entries(session.id, last_n=10) == 3
+    assert await repo.list_conversation_entries(session.id) == []
+
+    assert await repo.delete_conversation_entries(other.id) == 1
+    assert await repo.list_conversation_entries(other.id) == []
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_lists_long_history_across_stream_batches():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    repo = SessionRepositoryImpl(db)
+    session = Session(user_name="tester")
+    await repo.save(session)
+
+    now = datetime.now(timezone.utc)
+    await repo.append_conversation_entries(
+        session.id,
+        [
+            ConversationEntry(
+                timestamp=now,
+                topic="学校-德育",
+                question_type="核心问题",
+                question="Q",
+                answer=f"A{i}",
+            )
+            for i in range(600)
+        ],
+    )
+
+    entries = await repo.list_conversation_entries(session.id)
+    assert [e.answer for e in entries] == [f"A{i}" for i in range(600)]
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_tolerates_malformed_selected_topics():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    repo = SessionRepositoryImpl(db)
+    session = Session(user_name="tester")
+    await repo.save(session)
+    await db.execute(
+        "UPDATE sessions SET selected_topics = :raw", {"raw": "[not json"}
+    )
+
+    loaded = await repo.get(session.id)
+    assert loaded is not None
+    assert loaded.selected_topics == []
+
+    await db.dispose()
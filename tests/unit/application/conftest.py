@@ -21,8 +21,10 @@ class FakeRepo:
     async def get(self, session_id):  # type: ignore[override]
         return self.sessions.get(str(session_id))
 
-    async def save(self, session: Session) -> None:  # type: ignore[override]
+    async def save(self, session: Session, *, new_entries=()) -> None:  # type: ignore[override]
         self.sessions[str(session.id)] = session
+        if new_entries:
+            self.logs.setdefault(str(session.id), []).extend(new_entries)
 
     async def delete(self, session_id):  # type: ignore[override]
         self.sessions.pop(str(session_id), None)
@@ -37,12 +39,21 @@ class FakeRepo:
     ) -> None:  # type: ignore[override]
         self.logs.setdefault(str(session_id), []).append(entry)
 
+    async def append_conversation_entries(self, session_id, entries) -> None:  # type: ignore[override]
+        self.logs.setdefault(str(session_id), []).extend(entries)
+
     async def delete_last_conversation_entry(self, session_id):  # type: ignore[override]
         items = self.logs.get(str(session_id), [])
         if not items:
             return None
         return items.pop()
 
+    async def delete_conversation_entries(self, session_id, *, last_n=None) -> int:  # type: ignore[override]
+        items = self.logs.get(str(session_id), [])
+        count = len(items) if last_n is None else max(0, min(last_n, len(items)))
+        del items[len(items) - count :]
+        return count
+
 
 @pytest.fixture
 def fake_repo() -> FakeRepo:
@@ -15,3 +15,38 @@ def test_answer_processor_scores_depth_and_returns_result():
     assert result.topic == "学校-德育"
     assert result.question == "Q1"
     assert result.depth_score >= 1
+
+
+def test_answer_processor_analyze_normalizes_keywords_and_caps_score():
+    processor = AnswerProcessor(
+        depth_keywords=["具体", "Example", "具体", "经历"],
+        common_keywords=["时间", "TIME"],
+        max_depth_score=2,
+    )
+
+    depth, keywords = processor.analyze("具体的 example：那段时间 time 的经历")
+    assert depth == 2
+    assert keywords == ["时间", "time"]
+    assert processor.score_depth("具体") == 1
+    assert processor.extract_keywords("") == []
+
+
+def test_answer_processor_uses_shared_timestamp_when_given():
+    from datetime import datetime, timezone
+
+    processor = AnswerProcessor(
+        depth_keywords=["具体"], common_keywords=["时间"], max_depth_score=4
+    )
+    topic = {"name": "学校-德育", "questions": ["Q1"]}
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    core = processor.process_core_answer(answer="A", topic=topic, now=now)
+    followup = processor.process_followup_answer(
+        answer="B",
+        topic=topic,
+        followup_question="F",
+        is_ai_generated=False,
+        now=now,
+    )
+    assert core.timestamp is now
+    assert followup.timestamp is now
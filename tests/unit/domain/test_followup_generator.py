@@ -48,3 +48,32 @@ def test_followup_generator_falls_back_to_preset_when_forced():
     assert r.need_followup is True
     assert r.is_ai_generated is False
     assert r.followup_question in {"预设1", "预设2"}
+
+
+def test_followup_generator_accepts_precomputed_answer_length():
+    gen = FollowupGenerator(
+        llm=None,
+        min_answer_length=10,
+        max_followups_per_question=3,
+        max_depth_score=4,
+    )
+    answer = "这是一个足够长的回答内容"
+    r = gen.should_followup(
+        answer=answer,
+        topic={"followups": ["预设"]},
+        conversation_log=[],
+        current_followup_count=0,
+        depth_score=0,
+        answer_len=len(answer),
+    )
+    assert r.need_followup is False
+
+    r2 = gen.should_followup(
+        answer="短",
+        topic={"followups": ["预设"]},
+        conversation_log=[],
+        current_followup_count=0,
+        depth_score=0,
+        answer_len=1,
+    )
+    assert r2.need_followup is True
@@ -42,3 +42,64 @@ def test_select_questions_covers_all_scenes_and_edu_types():
     assert len(selected) == 6
     assert set(scenes).issubset({t["scene"] for t in selected})
     assert set(edu_types).issubset({t["edu_type"] for t in selected})
+
+
+def test_select_questions_pregrouped_matches_inline_grouping():
+    topics = [
+        {"name": "t1", "scene": "学校", "edu_type": "德育"},
+        {"name": "t2", "scene": "家庭", "edu_type": "智育"},
+        {"name": "t3", "scene": "社区", "edu_type": "体育"},
+        {"name": "t4", "scene": "学校", "edu_type": "美育"},
+        {"name": "t5", "scene": "家庭", "edu_type": "劳育"},
+        {"name": "t6", "scene": "社区", "edu_type": "德育"},
+    ]
+    scenes = ["学校", "家庭", "社区"]
+    edu_types = ["德育", "智育", "体育", "美育", "劳育"]
+    scene_groups = {s: tuple(t for t in topics if t["scene"] == s) for s in scenes}
+    edu_groups = {e: tuple(t for t in topics if t["edu_type"] == e) for e in edu_types}
+
+    inline = select_questions(
+        topics=topics, scenes=scenes, edu_types=edu_types, total_questions=5, seed=7
+    )
+    pregrouped = select_questions(
+        topics=topics,
+        scenes=scenes,
+        edu_types=edu_types,
+        total_questions=5,
+        seed=7,
+        scene_groups=scene_groups,
+        edu_groups=edu_groups,
+    )
+    assert [t["name"] for t in inline] == [t["name"] for t in pregrouped]
+
+
+def test_select_questions_fills_without_duplicates_and_caps_at_topic_count():
+    topics = [
+        {"name": f"t{i}", "scene": "学校", "edu_type": "德育"} for i in range(8)
+    ]
+
+    picked = select_questions(
+        topics=topics, scenes=["学校"], edu_types=["德育"], total_questions=5, seed=3
+    )
+    assert len(picked) == 5
+    assert len({t["name"] for t in picked}) == 5
+
+    everything = select_questions(
+        topics=topics, scenes=["学校"], edu_types=["德育"], total_questions=20, seed=3
+    )
+    assert sorted(t["name"] for t in everything) == sorted(t["name"] for t in topics)
+
+
+def test_select_questions_dedupes_pregrouped_topics_outside_topic_list():
+    extra = {"name": "x", "scene": "学校", "edu_type": "德育"}
+    for seed in range(10):
+        picked = select_questions(
+            topics=[],
+            scenes=["学校"],
+            edu_types=["德育"],
+            total_questions=3,
+            seed=seed,
+            scene_groups={"学校": [extra]},
+            edu_groups={"德育": [extra]},
+        )
+        assert picked == [extra]
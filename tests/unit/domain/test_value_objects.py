@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import astuple
+
 import pytest
 
 from interview_system.domain.value_objects import Answer, ConversationEntry, Question
@@ -35,3 +37,8 @@ def test_conversation_entry_immutable():
     )
     with pytest.raises(Exception):
         e.answer = "B"  # type: ignore[misc]
+
+    # 值对象不是元组：不可索引，也不与同值元组相等
+    assert e != astuple(e)
+    with pytest.raises(TypeError):
+        e[0]  # type: ignore[index]
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from interview_system.integrations import api_client
+from interview_system.integrations.api_client import UnifiedAPIClient, clear_env_cache
+from interview_system.integrations.api_providers import API_PROVIDERS
+
+TOPIC = {
+    "name": "学校-德育",
+    "questions": ["你参加过哪些志愿活动？"],
+    "followups": ["能具体说说吗？"],
+}
+
+
+def _response(content: str):
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _stream(*deltas: str):
+    for delta in deltas:
+        choice = SimpleNamespace(delta=SimpleNamespace(content=delta))
+        yield SimpleNamespace(choices=[choice])
+
+
+class _AsyncStream:
+    def __init__(self, *deltas: str):
+        self._chunks = _stream(*deltas)
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration from None
+        self.consumed += 1
+        return chunk
+
+    async def close(self):
+        self.closed = True
+
+
+def _async_client(completions) -> SimpleNamespace:
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+class FakeAsyncCompletions:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        answer = kwargs["messages"][1]["content"].split("【受访者最新回答】\n")[1]
+        return _AsyncStream(f"关于{answer[:4]}，", "这对你有什么影响？")
+
+
+def _client(monkeypatch) -> UnifiedAPIClient:
+    monkeypatch.delenv("API_PROVIDER", raising=False)
+    monkeypatch.delenv("API_KEY", raising=False)
+    clear_env_cache()
+    client = UnifiedAPIClient()
+    client.current_provider = API_PROVIDERS["deepseek"]
+    client.api_key = "test-key"
+    client.model = "deepseek-chat"
+    client.client = object()
+    client.is_available = True
+    return client
+
+
+@pytest.mark.asyncio
+async def test_generate_followup_batch_runs_concurrently(monkeypatch):
+    client = _client(monkeypatch)
+    completions = FakeAsyncCompletions()
+    monkeypatch.setattr(client, "_get_async_client", lambda: _async_client(completions))
+
+    results = await client.generate_followup_batch(
+        [("志愿服务经历", TOPIC), ("x", TOPIC), ("社团活动经历", TOPIC)]
+    )
+
+    assert results == [
+        "关于志愿服务，这对你有什么影响？",
+        None,
+        "关于社团活动，这对你有什么影响？",
+    ]
+    assert completions.max_in_flight == 2
+
+
+def test_generate_followup_reuses_cached_result(monkeypatch):
+    client = _client(monkeypatch)
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return _stream("这段经历", "让你有什么改变？")
+
+    client.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+    first = client.generate_followup("我参加了志愿服务", TOPIC)
+    second = client.generate_followup("我参加了志愿服务", TOPIC)
+    assert first == second == "这段经历让你有什么改变？"
+    assert len(calls) == 1
+
+    log = [{"topic": "学校-德育", "question_type": "核心问题", "question": "Q"}]
+    client.generate_followup("我参加了志愿服务", TOPIC, log)
+    assert len(calls) == 2
+
+    client.cache_clear()
+    client.generate_followup("我参加了志愿服务", TOPIC)
+    assert len(calls) == 3
+
+
+def test_generate_followup_stops_streaming_at_first_question(monkeypatch):
+    client = _client(monkeypatch)
+    consumed = []
+
+    def deltas():
+        for delta in _stream("追问：", "这段经历对你的", "价值观有何影响？", "另外……"):
+            consumed.append(delta)
+            yield delta
+
+    def create(**kwargs):
+        assert kwargs["stream"] is True
+        return deltas()
+
+    client.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+    result = client.generate_followup("我参加了志愿服务", TOPIC)
+    assert result == "这段经历对你的价值观有何影响？"
+    assert len(consumed) == 3
+
+
+def test_generate_followup_reinitializes_after_close(monkeypatch):
+    client = _client(monkeypatch)
+    created = []
+
+    def create(**kwargs):
+        return _stream("这段经历让你有什么改变？")
+
+    def make_client(**kwargs):
+        created.append(kwargs)
+        if len(created) == 1:
+            raise RuntimeError("connection refused")
+        return SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+    monkeypatch.setattr(api_client, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(api_client, "_get_http_client", lambda: None)
+    monkeypatch.setattr(
+        api_client, "_import_openai", lambda: SimpleNamespace(OpenAI=make_client)
+    )
+
+    client.close()
+    assert client.client is None and not client.is_available
+
+    # 首次初始化瞬时失败不应永久禁用客户端
+    assert client.generate_followup("我参加了志愿服务", TOPIC) is None
+    assert client.generate_followup("我参加了志愿服务", TOPIC) == (
+        "这段经历让你有什么改变？"
+    )
+    assert client.is_available
+    assert len(created) == 2
+
+
+def test_test_connection_requires_model_in_listing(monkeypatch):
+    client = _client(monkeypatch)
+    provider = API_PROVIDERS["deepseek"]
+    pings = []
+
+    def create(**kwargs):
+        pings.append(kwargs["model"])
+        raise RuntimeError("model not found")
+
+    fake = SimpleNamespace(
+        models=SimpleNamespace(list=lambda: [SimpleNamespace(id="deepseek-chat")]),
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create)),
+    )
+
+    assert client._test_connection(fake, "deepseek-chat", provider)
+    assert pings == []
+
+    assert not client._test_connection(fake, "deepseek-chta", provider)
+    assert pings == ["deepseek-chta"]
+
+
+def test_env_config_is_resolved_once_until_config_changes(monkeypatch, tmp_path):
+    monkeypatch.setattr(api_client, "ENV_FILE", str(tmp_path / ".env"))
+    monkeypatch.setattr(api_client, "API_CONFIG_FILE", str(tmp_path / "none.json"))
+    monkeypatch.setenv("API_PROVIDER", "qwen")
+    monkeypatch.setenv("API_KEY", "env-key")
+    monkeypatch.delenv("API_MODEL", raising=False)
+    clear_env_cache()
+    assert UnifiedAPIClient().current_provider is API_PROVIDERS["qwen"]
+
+    monkeypatch.setenv("API_PROVIDER", "zhipu")
+    assert UnifiedAPIClient().current_provider is API_PROVIDERS["qwen"]
+
+    # 保存/清除配置时失效快照，下一次加载重新读取环境变量
+    UnifiedAPIClient().clear_config()
+    client = UnifiedAPIClient()
+    assert client.current_provider is API_PROVIDERS["zhipu"]
+    assert client.model == "glm-4-flash"
+    clear_env_cache()
+
+
+def test_save_and_clear_config_rewrite_only_api_lines(monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "WEB_PORT=7860\n  API_KEY=old\n# 备注\n", encoding="utf-8"
+    )
+    env_file.chmod(0o640)
+    monkeypatch.setattr(api_client, "ENV_FILE", str(env_file))
+    monkeypatch.setattr(api_client, "API_CONFIG_FILE", str(tmp_path / "none.json"))
+    client = _client(monkeypatch)
+
+    assert client.save_config()
+    assert client.save_config()
+    assert env_file.read_text(encoding="utf-8") == (
+        "WEB_PORT=7860\n# 备注\n\n"
+        "# API Configuration\n"
+        "API_PROVIDER=deepseek\nAPI_KEY=test-key\nAPI_MODEL=deepseek-chat\n"
+    )
+
+    assert env_file.stat().st_mode & 0o777 == 0o640
+
+    client.clear_config()
+    assert env_file.read_text(encoding="utf-8") == "WEB_PORT=7860\n# 备注\n"
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]
+
+
+def test_clear_config_keeps_user_comments_like_the_header(monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# API Configuration notes: ask ops for keys\n"
+        "# API Configuration\n"
+        "WEB_PORT=7860\n"
+        "\n"
+        "# API Configuration\n"
+        "API_PROVIDER=deepseek\n"
+        "API_KEY=old\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(api_client, "ENV_FILE", str(env_file))
+    monkeypatch.setattr(api_client, "API_CONFIG_FILE", str(tmp_path / "none.json"))
+
+    _client(monkeypatch).clear_config()
+    assert env_file.read_text(encoding="utf-8") == (
+        "# API Configuration notes: ask ops for keys\n"
+        "# API Configuration\n"
+        "WEB_PORT=7860\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_agenerate_followup_retries_without_blocking(monkeypatch):
+    client = _client(monkeypatch)
+    client.retry_delay = 0.01
+    attempts = []
+
+    async def create(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) == 1:
+            raise RuntimeError("rate limited")
+        return _AsyncStream("这段经历让你有什么改变？")
+
+    aclient = _async_client(SimpleNamespace(create=create))
+    monkeypatch.setattr(client, "_get_async_client", lambda: aclient)
+
+    result = await client.agenerate_followup("我参加了志愿服务", TOPIC)
+    assert result == "这段经历让你有什么改变？"
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_agenerate_followup_stops_streaming_at_first_question(monkeypatch):
+    client = _client(monkeypatch)
+    stream = _AsyncStream("追问：", "这段经历对你的", "价值观有何影响？", "另外……")
+
+    async def create(**kwargs):
+        assert kwargs["stream"] is True
+        return stream
+
+    aclient = _async_client(SimpleNamespace(create=create))
+    monkeypatch.setattr(client, "_get_async_client", lambda: aclient)
+
+    result = await client.agenerate_followup("我参加了志愿服务", TOPIC)
+    assert result == "这段经历对你的价值观有何影响？"
+    assert stream.consumed == 3
+    assert stream.closed
+
+
+def test_async_client_is_created_per_event_loop(monkeypatch):
+    client = _client(monkeypatch)
+    built = []
+
+    def make_client(**kwargs):
+        built.append(kwargs)
+        return SimpleNamespace(kwargs=kwargs)
+
+    monkeypatch.setattr(api_client, "_get_http_client", lambda: None)
+    monkeypatch.setattr(
+        api_client, "_import_openai", lambda: SimpleNamespace(AsyncOpenAI=make_client)
+    )
+
+    async def get_twice():
+        first = client._get_async_client()
+        assert client._get_async_client() is first
+        return first
+
+    first = asyncio.run(get_twice())
+    second = asyncio.run(get_twice())
+    assert first is not second
+    assert len(built) == 2
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from interview_system.integrations.prompt_builder import PromptBuilder
+
+TOPIC = {"name": "学校-德育", "questions": ["你参加过哪些志愿活动？"]}
+
+
+def test_build_followup_prompt_numbers_followups_per_topic():
+    log = [
+        {"topic": "学校-德育", "question_type": "核心问题", "question": "Q", "answer": "A"},
+        {"topic": "家庭-智育", "question_type": "追问", "question": "X", "answer": "Y"},
+        {"topic": "学校-德育", "question_type": "追问", "question": "F1", "answer": "B"},
+        {"topic": "学校-德育", "question_type": "AI追问", "question": "F2", "answer": "C"},
+    ]
+    prompt = PromptBuilder.build_followup_prompt("回答", TOPIC, log)
+    indexed = PromptBuilder.index_by_topic(log)
+    assert PromptBuilder.build_followup_prompt("回答", TOPIC, indexed) == prompt
+
+    assert "【核心问题】Q\n【回答】A" in prompt
+    assert "【追问1】F1\n【回答】B" in prompt
+    assert "【追问2】F2\n【回答】C" in prompt
+    assert "X\n【回答】Y" not in prompt
+    assert "【访谈主题】德育（学校场景）" in prompt
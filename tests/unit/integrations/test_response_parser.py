@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from interview_system.integrations.response_parser import ResponseParser
+
+QUESTION = "你参加过哪些志愿活动？"
+PRESETS = ["能具体说说吗？"]
+
+
+def _response(content: str):
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def test_extract_followup_strips_prefix_and_quotes():
+    cases = {
+        "**追问**： 这次经历让你有什么改变？": "这次经历让你有什么改变？",
+        '追问："具体是什么促使你参加的？"': "具体是什么促使你参加的？",
+        "“这件事对你意味着什么？”": "这件事对你意味着什么？",
+    }
+    for content, expected in cases.items():
+        result = ResponseParser.extract_followup(
+            _response(content), QUESTION, PRESETS, 0.1
+        )
+        assert result == expected
+
+
+def test_extract_followup_keeps_inner_quotes():
+    text = '你提到的"坚持"具体指什么？'
+    result = ResponseParser.extract_followup(_response(text), QUESTION, PRESETS, 0.1)
+    assert result == text
+
+
+def test_extract_followup_rejects_preset_or_original_question():
+    for text in (PRESETS[0], QUESTION):
+        response = _response(text)
+        assert ResponseParser.extract_followup(response, QUESTION, PRESETS, 0.1) is None
+
+
+def test_extract_followup_falls_back_to_reasoning_content():
+    reasoning = "思考过程……\n这段志愿经历对你的价值观有何影响？\n"
+    message = SimpleNamespace(content=None, reasoning_content=reasoning)
+    response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    result = ResponseParser.extract_followup(response, QUESTION, PRESETS, 0.1)
+    assert result == "这段志愿经历对你的价值观有何影响？"
+
+    empty = SimpleNamespace(choices=[SimpleNamespace(message=None)])
+    assert ResponseParser.extract_followup(empty, QUESTION, PRESETS, 0.1) is None